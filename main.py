@@ -18,10 +18,13 @@
 
 import os
 os.environ["PYQTGRAPH_QT_LIB"] = "PyQt6"
-os.environ.setdefault("QT_OPENGL", "software")
 os.environ.setdefault("QT_WIDGETS_HIGDPI", "1")
+# native OpenGL is opt-in (DASH_OPENGL=1); by default Qt stays on software GL, safe with broken or missing drivers
+if os.environ.get("DASH_OPENGL") != "1": os.environ.setdefault("QT_OPENGL", "software")
 
-import sys, csv, numpy as np, pandas as pd
+import glob, hashlib, importlib.util, re, sys, tempfile, threading, time, warnings, numpy as np, pandas as pd
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import pyqtgraph as pg
 from pyqtgraph.Qt import QtCore, QtGui, QtWidgets
 
@@ -32,29 +35,130 @@ try:
 except Exception:
     HAS_POLARS = False
 
+# Optional pyarrow CSV reader (used when Polars is missing; not imported otherwise)
+HAS_PYARROW = False
+if not HAS_POLARS:
+    try:
+        import pyarrow as pa, pyarrow.csv as pacsv
+        HAS_PYARROW = True
+    except Exception:
+        pass
+
+# Optional Numba (JIT kernels; NumPy fallback otherwise). Only probed at startup: the import happens on the
+# thread pool right after the window is shown (DASH.warm_jit_async), or on the first kernel call
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+numba = None
+
+def _import_numba():
+    global numba
+    if numba is None: import numba   # kernels resolve numba.prange from module globals
+
+# kernel call sites check this: imports numba on first use; a broken install (e.g. a NumPy ABI mismatch)
+# switches to the NumPy kernels for good instead of failing the caller
+def _jit_ready():
+    global HAS_NUMBA
+    if HAS_NUMBA and numba is None:
+        try: _import_numba()
+        except Exception: HAS_NUMBA = False
+    return HAS_NUMBA
+
+# one parallel kernel at a time: the GUI thread and the pool both call them, and numba's fallback threading
+# layer (workqueue, when neither tbb nor omp is installed) aborts the process on concurrent launches
+_JIT_LOCK = threading.Lock()
+
+def _lazy_njit(**opts):
+    def wrap(fn):
+        jitted = []
+        def call(*args):
+            with _JIT_LOCK:
+                if not jitted:
+                    _import_numba()
+                    jitted.append(numba.njit(**opts)(fn))
+                return jitted[0](*args)
+        return call
+    return wrap
+
 # Timezone
 try:
     from zoneinfo import ZoneInfo
     KST = ZoneInfo("Asia/Seoul")
 except Exception:
-    from datetime import timezone, timedelta
     KST = timezone(timedelta(hours=9), name="KST")
 
+# epoch ns -> "YYYY-mm-dd HH:MM:SS[.mmm]" in KST; the calendar part is formatted once per whole second
+# (epoch + timedelta, not fromtimestamp: that raises OSError on Windows before 1970)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+@lru_cache(maxsize=4096)
+def _kst_second(sec):
+    return (_EPOCH + timedelta(seconds=sec)).astimezone(KST).strftime("%Y-%m-%d %H:%M:%S")
+
+def fmt_kst(ns, ms=True):
+    sec, rem = divmod(int(ns), 1_000_000_000)
+    return f"{_kst_second(sec)}.{rem // 1_000_000:03d}" if ms else _kst_second(sec)
+
 TIME_COL = "Date UTC"
 TIME_COL_CANDIDATES = ["Date UTC","UTC","Timestamp","DateTime","Datetime","Date_Time","Date","Time","time","date","datetime"]
 
-pg.setConfigOptions(antialias=False, useOpenGL=False)
+try: from pandas.tseries.api import guess_datetime_format
+except Exception: guess_datetime_format = None
 
+# known timestamp layouts: (strptime probes, Polars format, pandas format); "%.f" = optional fraction in Polars
+TIME_FORMATS = [
+    (("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S.%f"), "%Y-%m-%d %H:%M:%S%.f", "ISO8601"),
+    (("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f"), "%Y-%m-%dT%H:%M:%S%.f", "ISO8601"),
+    (("%Y/%m/%d %H:%M:%S", "%Y/%m/%d %H:%M:%S.%f"), "%Y/%m/%d %H:%M:%S%.f", None),
+]
+
+# OpenGL curve rendering is opt-in: DASH_OPENGL=1 at startup or the "GL" toggle (needs PyOpenGL); CPU raster by default
+try:
+    import OpenGL  # noqa: F401
+    HAS_OPENGL = True
+except Exception:
+    HAS_OPENGL = False
+USE_OPENGL = HAS_OPENGL and os.environ.get("DASH_OPENGL") == "1"
+try:
+    pg.setConfigOptions(antialias=False, useOpenGL=USE_OPENGL, enableExperimental=USE_OPENGL)
+except Exception:
+    USE_OPENGL = False
+    pg.setConfigOptions(antialias=False, useOpenGL=False)
+
+# delimiter = candidate present on every sampled line with the most consistent per-line count
+# (lowest std, then highest mean); space only when nothing else qualifies. No regex, no backtracking.
+def _pick_delimiter(data, truncated, max_lines=50):
+    buf = np.frombuffer(data, dtype=np.uint8)
+    nl = np.flatnonzero(buf == 10)
+    if nl.size >= max_lines: buf = buf[:nl[max_lines-1]]
+    elif truncated and nl.size: buf = buf[:nl[-1]]            # drop the cut-off last line
+    if buf.size == 0: return None
+    line_id = np.cumsum(buf == 10)
+    n_lines = int(line_id[-1]) + 1
+    keep = np.bincount(line_id, minlength=n_lines) > 2       # ignore blank lines
+    if not keep.any(): return None
+    best = None; best_score = None
+    for c in b",\t;|":
+        cnt = np.bincount(line_id[buf == c], minlength=n_lines)[keep]
+        if cnt.min() == 0: continue
+        score = (float(cnt.std()), -float(cnt.mean()))
+        if best_score is None or score < best_score: best, best_score = chr(c), score
+    if best is None and np.bincount(line_id[buf == 32], minlength=n_lines)[keep].min() > 0:
+        best = ' '
+    return best
+
+# one read of the file head -> (delimiter or None, header fields)
 def sniff_delimiter_quick(path, sample_bytes=32768):
+    ext = os.path.splitext(path)[1].lower()
     try:
         with open(path, 'rb') as f:
-            text = f.read(sample_bytes).decode('utf-8', errors='ignore')
-        dialect = csv.Sniffer().sniff(text, delimiters=",\t;| ")
-        d = dialect.delimiter
-        return '\t' if (d == ' ' and text.count('\t') > text.count(' ')) else d
+            data = f.read(sample_bytes)
     except Exception:
-        ext = os.path.splitext(path)[1].lower()
-        return None if ext in ['.tsv', '.dat'] else ','
+        data = b""
+    text = data[:8192].decode('utf-8', errors='ignore').lstrip('\ufeff')
+    d = '\t' if ext == '.tsv' else _pick_delimiter(data, len(data) == sample_bytes)
+    if d is None: d = None if ext == '.dat' else ','
+    header_line = text.split('\n', 1)[0].rstrip('\r')
+    header = [h.strip().strip('"') for h in (header_line.split(d) if d else header_line.split())]
+    return d, header
 
 def is_numeric_polars_dtype(dt):
     try:
@@ -65,23 +169,472 @@ def is_numeric_polars_dtype(dt):
     except Exception:
         return False
 
+# ordered: when several keys occur in a name, the earlier entry wins (same as the old linear scan)
+_UNIT_KEYS = (
+    ("_temp", "°C"), ("temperature", "°C"),
+    ("_volt", "V"),  ("voltage", "V"),
+    ("_curr", "A"),  ("current", "A"),
+    ("_press","Pa"), ("pressure","Pa"),
+    ("_flow","sccm"),("flow","sccm"),
+    ("_rpm","rpm"),
+    ("_freq","Hz"),  ("frequency","Hz"),
+    ("_power","W"),  ("power","W"),
+    ("_hum","%"),    ("humidity","%"),
+)
+_UNIT_MAP  = dict(_UNIT_KEYS)
+_UNIT_RANK = {k: i for i, (k, _) in enumerate(_UNIT_KEYS)}
+_UNIT_RE   = re.compile("|".join(sorted(map(re.escape, _UNIT_MAP), key=len, reverse=True)))
+
 def unit_from_name(name: str) -> str:
-    n = name.lower()
-    mapping = [
-        ("_temp", "°C"), ("temperature", "°C"),
-        ("_volt", "V"),  ("voltage", "V"),
-        ("_curr", "A"),  ("current", "A"),
-        ("_press","Pa"), ("pressure","Pa"),
-        ("_flow","sccm"),("flow","sccm"),
-        ("_rpm","rpm"),
-        ("_freq","Hz"),  ("frequency","Hz"),
-        ("_power","W"),  ("power","W"),
-        ("_hum","%"),    ("humidity","%"),
-    ]
-    for key, u in mapping:
-        if key in n:
-            return u
-    return ""
+    hits = _UNIT_RE.findall(name.lower())   # one compiled pass instead of 17 substring scans
+    return _UNIT_MAP[min(hits, key=_UNIT_RANK.__getitem__)] if hits else ""
+
+# value matrix precision: float32 halves memory and bandwidth for big files (plots and 6-digit readouts
+# don't need more); DASH_FLOAT32=1 / 0 forces it, otherwise used once the float64 matrix passes 1 GiB
+FLOAT32_ABOVE_BYTES = 1 << 30
+
+def value_dtype(nbytes):
+    force = os.environ.get("DASH_FLOAT32")
+    if force is not None: return np.float32 if force not in ("", "0") else np.float64
+    return np.float32 if nbytes > FLOAT32_ABOVE_BYTES else np.float64
+
+# rows with at least one finite value + finite count per column, one column at a time (no N x C bool temp)
+def finite_rows(Y):
+    valid_row = np.zeros(Y.shape[0], dtype=bool); fin = np.empty(Y.shape[0], dtype=bool)
+    n_finite = np.zeros(Y.shape[1], dtype=np.int64)
+    for j in range(Y.shape[1]):
+        np.isfinite(Y[:, j], out=fin)
+        np.logical_or(valid_row, fin, out=valid_row)
+        n_finite[j] = np.count_nonzero(fin)
+    return valid_row, n_finite
+
+# per-series summary of the finite values, computed once per load: {n_finite, nonzero, ymin, ymax, absmax, std}
+def column_stats(Y, n_finite, all_finite):
+    out = []
+    for j in range(Y.shape[1]):
+        if n_finite[j] == 0:
+            out.append(dict(n_finite=0, nonzero=0, ymin=np.nan, ymax=np.nan, absmax=np.nan, std=np.nan)); continue
+        y = Y[:, j] if all_finite[j] else Y[:, j][np.isfinite(Y[:, j])]
+        lo = float(y.min()); hi = float(y.max())
+        out.append(dict(n_finite=int(n_finite[j]), nonzero=int(np.count_nonzero(y)), ymin=lo, ymax=hi,
+                        absmax=max(abs(lo), abs(hi)), std=float(y.std(dtype=np.float64))))
+    return out
+
+if HAS_NUMBA:
+    @_lazy_njit(parallel=True, cache=True)
+    def _normalize_columns_jit(Y, out):
+        for j in numba.prange(Y.shape[1]):     # one min/max pass + one scale pass per column, columns in parallel
+            mn = np.inf; mx = -np.inf
+            for i in range(Y.shape[0]):
+                v = Y[i, j]
+                if v < mn: mn = v
+                if v > mx: mx = v
+            rng = mx - mn
+            if np.isfinite(mn) and np.isfinite(mx) and rng > 0:
+                for i in range(Y.shape[0]): out[i, j] = (Y[i, j] - mn) / rng
+            else:
+                for i in range(Y.shape[0]): out[i, j] = 0.0
+
+# min-max scale every column of a (rows x series) matrix to 0..1; flat / all-NaN columns -> 0
+def normalize_columns(Y):
+    if Y.shape[0] == 0:
+        return np.zeros_like(Y)
+    if _jit_ready():
+        out = np.empty(Y.shape, dtype=Y.dtype, order='F')
+        _normalize_columns_jit(Y, out)
+        return out
+    with np.errstate(invalid="ignore", divide="ignore"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)   # all-NaN columns
+        ymin = np.nanmin(Y, axis=0); ymax = np.nanmax(Y, axis=0)
+        rng = ymax - ymin
+        ok = np.isfinite(ymin) & np.isfinite(ymax) & (rng > 0)
+        out = (Y - ymin) / np.where(ok, rng, 1.0)
+    out[:, ~ok] = 0.0
+    return np.asfortranarray(out)
+
+def _parses(v, f):
+    try: datetime.strptime(v, f); return True
+    except ValueError: return False
+
+# first timestamps -> (polars_fmt, pandas_fmt), or None to fall back to per-row inference
+def detect_time_format(samples):
+    vals = [str(s).strip() for s in samples]
+    if not vals: return None
+    for probes, pl_fmt, pd_fmt in TIME_FORMATS:
+        for f in probes:
+            if _parses(vals[0], f): return pl_fmt, (pd_fmt or f)
+    # other layouts: pandas' (dateutil based) guess, pinned only if tz-naive and every sample parses with it
+    # (day-first wins on ambiguous dates, as Polars' own inference did; month-first once a sample rules it out)
+    if guess_datetime_format is None: return None
+    for dayfirst in (True, False):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            f = guess_datetime_format(vals[0], dayfirst=dayfirst)
+        if f and "%z" not in f and "%Z" not in f and all(_parses(v, f) for v in vals):
+            return f.replace(".%f", "%.f"), f
+    return None
+
+# display variants of the value matrix: linear (+/-Inf -> NaN) and log (|y| > 0, else NaN)
+def linear_display(Y):
+    return Y if not np.isinf(Y).any() else np.asfortranarray(np.where(np.isfinite(Y), Y, np.nan))
+
+def log_display(Y):
+    A = np.abs(Y)
+    with np.errstate(invalid="ignore"):
+        A[~(np.isfinite(A) & (A > 0))] = np.nan
+    return A
+
+# ---------- condition scan: rule values are NaN when unused ----------
+# |Δy / y_prev| in %; NaN at i=0 and wherever y_prev == 0 (never divides by zero)
+def delta_pct(y):
+    pct = np.full(y.shape, np.nan)
+    if y.size > 1:
+        prev = y[:-1]; out = pct[1:]; nz = prev != 0
+        np.subtract(y[1:], prev, out=out, where=nz); np.divide(out, prev, out=out, where=nz)
+        np.abs(out, out=out); out *= 100.0
+    return pct
+
+EV_GT, EV_LT, EV_DP = 1, 2, 4   # hit codes (bit flags) returned by scan_events
+
+def _scan_events_numpy(Y, cols, gt, lt, dp):
+    parts = []
+    for k, j in enumerate(cols):
+        rows = np.flatnonzero(np.isfinite(Y[:, j])); yy = Y[rows, j]
+        code = np.zeros(yy.shape, dtype=np.int8); pct = np.full(yy.shape, np.nan)
+        if not np.isnan(gt[k]): code[yy > gt[k]] |= EV_GT
+        if not np.isnan(lt[k]): code[yy < lt[k]] |= EV_LT
+        if not np.isnan(dp[k]):
+            pct = delta_pct(yy)
+            with np.errstate(invalid='ignore'): code[pct >= dp[k]] |= EV_DP
+        hit = np.flatnonzero(code)
+        parts.append((np.full(hit.size, k, dtype=np.int64), rows[hit], code[hit], pct[hit]))
+    if not parts: return tuple(np.empty(0, dtype=t) for t in (np.int64, np.int64, np.int8, np.float64))
+    return tuple(np.concatenate(a) for a in zip(*parts))
+
+if HAS_NUMBA:
+    @_lazy_njit(parallel=True, cache=True)
+    def _scan_events_jit(Y, cols, gt, lt, dp, start, rows, codes, pcts, count_only):
+        # one column per thread; count_only: start[k] <- hits in column k, else write hits from start[k] on
+        for k in numba.prange(cols.size):
+            j = cols[k]; n = start[k]; prev = np.nan
+            for i in range(Y.shape[0]):
+                v = Y[i, j]
+                if not np.isfinite(v): continue
+                code = 0; pct = np.nan
+                if gt[k] == gt[k] and v > gt[k]: code |= 1
+                if lt[k] == lt[k] and v < lt[k]: code |= 2
+                if dp[k] == dp[k] and prev == prev and prev != 0:
+                    pct = abs((v - prev) / prev) * 100.0
+                    if pct >= dp[k]: code |= 4
+                prev = v
+                if code:
+                    if not count_only: rows[n] = i; codes[n] = code; pcts[n] = pct
+                    n += 1
+            start[k] = n
+
+# rule hits over matrix columns `cols` (finite values only; Δ% against the previous finite value)
+# -> (position in cols, row, EV_* code, Δ%) sorted by column then row; rule arrays hold NaN when unused
+def scan_events(Y, cols, gt, lt, dp):
+    cols = np.asarray(cols, dtype=np.int64)
+    gt, lt, dp = (np.asarray(a, dtype=np.float64) for a in (gt, lt, dp))
+    if not _jit_ready(): return _scan_events_numpy(Y, cols, gt, lt, dp)
+    cnt = np.zeros(cols.size, dtype=np.int64); e = np.empty(0, dtype=np.int64)
+    _scan_events_jit(Y, cols, gt, lt, dp, cnt, e, e.astype(np.int8), e.astype(np.float64), True)
+    start = np.zeros(cols.size, dtype=np.int64); np.cumsum(cnt[:-1], out=start[1:])
+    total = int(cnt.sum())
+    rows = np.empty(total, dtype=np.int64); codes = np.empty(total, dtype=np.int8); pcts = np.empty(total)
+    _scan_events_jit(Y, cols, gt, lt, dp, start, rows, codes, pcts, False)
+    return np.repeat(np.arange(cols.size, dtype=np.int64), cnt), rows, codes, pcts
+
+# numba's parallel layer must first start on the GUI thread (TBB hangs at exit when a pool thread starts it);
+# starting it takes a few ms once numba is imported, so kernels can then compile and run on the pool
+@lru_cache(maxsize=None)
+def launch_jit_threads():
+    if _jit_ready():
+        try:
+            from numba.np.ufunc.parallel import _launch_threads
+            _launch_threads()
+        except Exception: pass
+
+# compile every kernel once (cache=True: a disk load after the first run); on the pool, after launch_jit_threads
+@lru_cache(maxsize=None)
+def warm_jit():
+    if _jit_ready():
+        try:
+            scan_events(np.asfortranarray(np.array([[1.0], [2.0], [0.0]])), [0], [1.5], [np.nan], [10.0])
+            normalize_columns(np.asfortranarray(np.array([[1.0], [2.0]])))
+            m4_pyramid(np.arange(64, dtype=np.float64))
+        except Exception: pass
+
+# ---------- M4 level of detail: per bucket of b samples keep first / min / max / last ----------
+LOD_MIN_BUCKET = 16      # finest pyramid level; views with <= 16 samples per pixel are drawn raw
+LOD_FACTOR = 4           # bucket growth per level
+LOD_MIN_BUCKETS = 256    # stop once a level is narrower than any plot
+
+# per group of g consecutive entries: position of the smallest v_lo / largest v_hi (NaN never wins
+# unless the whole group is NaN, then the group's first entry)
+def _group_extrema(v_lo, v_hi, g):
+    n = v_lo.size; nf = n // g; nb = -(-n // g)
+    if np.isnan(v_lo).any(): v_lo = np.where(np.isnan(v_lo), np.inf, v_lo)
+    if np.isnan(v_hi).any(): v_hi = np.where(np.isnan(v_hi), -np.inf, v_hi)
+    lo = np.empty(nb, dtype=np.int64); hi = np.empty(nb, dtype=np.int64)
+    lo[:nf] = v_lo[:nf*g].reshape(nf, g).argmin(axis=1); hi[:nf] = v_hi[:nf*g].reshape(nf, g).argmax(axis=1)
+    if nb > nf: lo[nf] = v_lo[nf*g:].argmin(); hi[nf] = v_hi[nf*g:].argmax()
+    base = np.arange(0, nb * g, g, dtype=np.int64)
+    return lo + base, hi + base
+
+if HAS_NUMBA:
+    @_lazy_njit(parallel=True, cache=True)
+    def _m4_buckets_jit(y, b, imin, imax):
+        n = y.size
+        for k in numba.prange(imin.size):      # buckets in parallel, one pass over the raw series
+            s = k * b; e = min(s + b, n); lo = s; hi = s; vlo = np.inf; vhi = -np.inf
+            for i in range(s, e):
+                v = y[i]
+                if v < vlo: vlo = v; lo = i
+                if v > vhi: vhi = v; hi = i
+            imin[k] = lo; imax[k] = hi
+
+# [(b, imin, imax), ...] from finest to coarsest; only the first level scans the raw series
+def m4_pyramid(y):
+    b = LOD_MIN_BUCKET
+    if _jit_ready():
+        nb = -(-y.size // b); imin = np.empty(nb, dtype=np.int64); imax = np.empty(nb, dtype=np.int64)
+        _m4_buckets_jit(np.ascontiguousarray(y), b, imin, imax)
+    else:
+        imin, imax = _group_extrema(y, y, b)
+    levels = [(b, imin, imax)]
+    while imin.size // LOD_FACTOR >= LOD_MIN_BUCKETS:
+        lo, _ = _group_extrema(y[imin], y[imin], LOD_FACTOR); _, hi = _group_extrema(y[imax], y[imax], LOD_FACTOR)
+        imin = imin[lo]; imax = imax[hi]; b *= LOD_FACTOR
+        levels.append((b, imin, imax))
+    return levels
+
+# sample indices for rows [i0, i1) of an n-row series: coarsest level with >= width buckets in range,
+# 4 points per bucket in index order (~4 points per pixel column)
+def m4_select(levels, i0, i1, width, n):
+    b, imin, imax = levels[0]
+    for lvl in levels[1:]:
+        if (i1 - i0) // lvl[0] < width: break
+        b, imin, imax = lvl
+    k0 = i0 // b; k1 = min(-(-i1 // b), imin.size)
+    lo = imin[k0:k1]; hi = imax[k0:k1]; starts = np.arange(k0 * b, k1 * b, b, dtype=np.int64)
+    idx = np.empty((k1 - k0, 4), dtype=np.int64)
+    idx[:, 0] = starts; np.minimum(lo, hi, out=idx[:, 1]); np.maximum(lo, hi, out=idx[:, 2])
+    np.minimum(starts + b, n, out=idx[:, 3]); idx[:, 3] -= 1
+    return (b, k0, k1), idx.ravel()
+
+# ---------- Parquet sidecar of a full Polars parse (time parsed + sorted, series Float64) ----------
+# files above the threshold are re-read from the sidecar until they change; DASH_PARQUET_CACHE=1 / 0 forces it,
+# unset or empty keeps the size rule. The directory is trimmed on every write: least recently used first
+PARQUET_CACHE_ABOVE_BYTES = 64 << 20
+PARQUET_CACHE_DIR = os.path.join(tempfile.gettempdir(), "dash_cache")
+PARQUET_CACHE_MAX_BYTES = 4 << 30
+PARQUET_CACHE_MAX_AGE_S = 14 * 86400
+
+def parquet_cache_path(path):
+    force = os.environ.get("DASH_PARQUET_CACHE")
+    try: st = os.stat(path)
+    except OSError: return None
+    if force == "0": return None
+    elif not force:   # unset or empty: default rule
+        if st.st_size <= PARQUET_CACHE_ABOVE_BYTES: return None
+    # one sidecar per source path; the file state (size, mtime) is part of the name -> edits invalidate it
+    who = hashlib.md5(os.path.abspath(path).encode()).hexdigest()[:12]
+    state = hashlib.md5(f"{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:12]
+    return os.path.join(PARQUET_CACHE_DIR, f"{os.path.splitext(os.path.basename(path))[0]}.{who}.{state}.parquet")
+
+def _write_parquet_cache(df, cache):
+    try:
+        os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+        for old in glob.glob(glob.escape(cache.rsplit(".", 2)[0]) + ".*.parquet"): os.remove(old)   # stale states
+        tmp = cache + ".tmp"; df.write_parquet(tmp, compression="zstd", compression_level=1); os.replace(tmp, cache)
+    except OSError: pass   # best effort: a read-only / full temp dir just means no cache
+    _evict_parquet_cache(keep=cache)
+
+def _evict_parquet_cache(keep=None):
+    # sidecars of files that were never reopened: drop the old ones, then the least recently used over the size cap
+    files = []
+    for f in glob.glob(os.path.join(glob.escape(PARQUET_CACHE_DIR), "*.parquet")):
+        try: st = os.stat(f)
+        except OSError: continue
+        files.append((st.st_mtime, st.st_size, f))
+    files.sort(reverse=True)   # newest first
+    now = time.time(); total = 0
+    for mtime, size, f in files:
+        if f == keep or (now - mtime <= PARQUET_CACHE_MAX_AGE_S and total + size <= PARQUET_CACHE_MAX_BYTES):
+            total += size; continue
+        try: os.remove(f)
+        except OSError: pass
+
+def _collect_streaming(lf):
+    try: return lf.collect(engine="streaming")
+    except TypeError: return lf.collect(streaming=True)   # older Polars
+
+# parse a data file -> (time_col, numeric cols, x_ns int64 sorted, Y matrix rows x series Fortran, value_dtype);
+# cols: only these series are parsed (plus the time column), e.g. the columns a compare file shares with the main one
+def read_table(path, delim, start_dt=None, end_dt=None, cols=None):
+    keep = None if cols is None else set(cols)
+    if HAS_POLARS:
+        # lazy scan: only the time column + numeric series are parsed, time filter runs in the reader
+        cache = parquet_cache_path(path); cached = cache is not None and os.path.isfile(cache)
+        if cached:   # sidecar of an earlier full parse: the one Datetime column is the time axis
+            try: os.utime(cache)   # mtime = last use, for the eviction order
+            except OSError: pass
+            lf = pl.scan_parquet(cache); schema = lf.collect_schema()
+            tcol = next(c for c, dt in schema.items() if dt == pl.Datetime)
+        else:
+            lf = pl.scan_csv(path, infer_schema_length=10000, has_header=True, separator=delim or ',')
+            schema = lf.collect_schema()
+            tcol = next((c for c in TIME_COL_CANDIDATES if c in schema), schema.names()[0])
+        num_cols = [c for c, dt in schema.items() if c not in (tcol, "_ts_") and is_numeric_polars_dtype(dt)
+                    and (keep is None or c in keep)]
+        if not num_cols: raise ValueError("No numeric series to plot.")
+        if not cached:
+            # re-plan with the inferred schema pinned: the collects below skip the inference probe, and series parse
+            # straight to Float64 (an Int64 guess from the first rows can't fail on a later "1.5")
+            lf = pl.scan_csv(path, schema={**dict(schema), **dict.fromkeys(num_cols, pl.Float64)}, has_header=True, separator=delim or ',')
+        # naive UTC epoch ns end to end; KST only exists at display time (DateAxisItem utcOffset, labels)
+        if cached: ts_expr = pl.col(tcol)
+        elif schema[tcol] == pl.Utf8:
+            head = lf.select(pl.col(tcol)).head(64).collect()[tcol].drop_nulls()
+            fmt = detect_time_format(head.to_list())
+            ts_expr = (pl.col(tcol).str.strptime(pl.Datetime("ns"), format=fmt[0], strict=False) if fmt else
+                       pl.col(tcol).str.strptime(pl.Datetime("ns"), strict=False, exact=False))
+        elif schema[tcol] in (pl.Datetime, pl.Date):
+            ts_expr = pl.col(tcol).cast(pl.Datetime("ns"))
+        else:   # dtype decides up front: no full-column parse attempt on numbers
+            raise ValueError(f"Time column '{tcol}' is not a date/time column ({schema[tcol]}).")
+        # series cast to Float64 inside the plan: no supertype resolution when the matrix is filled below
+        q = lf.select([pl.col(tcol), pl.col(num_cols).cast(pl.Float64)]).with_columns(ts_expr.alias("_ts_")).drop_nulls(["_ts_"])
+        if start_dt is not None: q = q.filter(pl.col("_ts_").cast(pl.Int64) >= int(start_dt.value))
+        if end_dt   is not None: q = q.filter(pl.col("_ts_").cast(pl.Int64) <= int(end_dt.value))
+        df = _collect_streaming(q if cached else q.sort("_ts_"))   # the sidecar is stored sorted
+        if cache is not None and not cached and keep is None and start_dt is None and end_dt is None:
+            _write_parquet_cache(df.select(pl.col("_ts_").alias(tcol), *num_cols), cache)
+        x_ns = df["_ts_"].to_numpy().view("int64")
+        # one Fortran matrix at the store precision, filled column by column (not one to_numpy of the frame): each
+        # df[c].to_numpy() is a view or a one-column temp, so a float32 store never sits next to a float64 matrix
+        Y = np.empty((df.height, len(num_cols)), dtype=value_dtype(df.height * len(num_cols) * 8), order="F")
+        for j, c in enumerate(num_cols): Y[:, j] = df[c].to_numpy()
+    else:
+        # projection: first column (time fallback) + time candidates + wanted series, by the reader's own header names
+        pick = None if keep is None else (lambda names: [names[0]] + [c for c in names[1:] if c in keep or c in TIME_COL_CANDIDATES])
+        if HAS_PYARROW and not (delim is None and os.environ.get("DASH_CSV_PYTHON_ENGINE")):
+            # Arrow table straight to NumPy: only the time column goes through pandas (no full-frame to_pandas)
+            popts = pacsv.ParseOptions(delimiter=delim or ','); ropts = pacsv.ReadOptions(block_size=8 << 20)
+            copts = pacsv.ConvertOptions()
+            if pick:   # header from the streaming reader (first block only), closed before the full read reopens the file
+                with pacsv.open_csv(path, parse_options=popts, read_options=ropts) as reader: names = reader.schema.names
+                copts = pacsv.ConvertOptions(include_columns=pick(names))
+            tbl = pacsv.read_csv(path, parse_options=popts, read_options=ropts, convert_options=copts)
+            names = tbl.column_names
+            tcol = next((c for c in TIME_COL_CANDIDATES if c in names), names[0])
+            tser = tbl.column(tcol).to_pandas()
+            num_cols = [f.name for f in tbl.schema if f.name not in (tcol, "_ts_") and (keep is None or f.name in keep)
+                        and (pa.types.is_integer(f.type) or pa.types.is_floating(f.type) or pa.types.is_boolean(f.type))]
+            column = lambda c: tbl.column(c).cast(pa.float64()).to_numpy()   # nulls -> NaN
+        else:
+            if delim is None and os.environ.get("DASH_CSV_PYTHON_ENGINE"):   # escape hatch: pandas delimiter sniffing
+                read = lambda **kw: pd.read_csv(path, sep=None, engine="python", **kw)
+            else:
+                read = lambda **kw: pd.read_csv(path, sep=delim or ',', **kw)
+            df = read(usecols=pick(list(read(nrows=0).columns)) if pick else None)
+            tcol = next((c for c in TIME_COL_CANDIDATES if c in df.columns), df.columns[0])
+            tser = df[tcol]
+            num_cols = [c for c in df.columns if c not in (tcol, "_ts_") and pd.api.types.is_numeric_dtype(df[c])
+                        and (keep is None or c in keep)]
+            column = lambda c: df[c].to_numpy(dtype="float64")
+        if not num_cols: raise ValueError("No numeric series to plot.")
+        if pd.api.types.is_numeric_dtype(tser) or pd.api.types.is_bool_dtype(tser):
+            raise ValueError(f"Time column '{tcol}' is not a date/time column ({tser.dtype}).")
+        head = tser.head(64).dropna()
+        fmt = detect_time_format(head.tolist()) if pd.api.types.is_string_dtype(tser) else None
+        ts = (pd.to_datetime(tser, format=fmt[1], errors="coerce", cache=True) if fmt else
+              pd.to_datetime(tser, errors="coerce"))
+        if ts.dt.tz is not None: ts = ts.dt.tz_convert("UTC").dt.tz_localize(None)   # pyarrow may pre-parse
+        # parsed, in range, sorted by time -> one row selection applied to every column
+        ns = ts.to_numpy(dtype="datetime64[ns]").view("int64"); ok = ts.notna().to_numpy()
+        if start_dt is not None: ok &= ns >= int(start_dt.value)
+        if end_dt   is not None: ok &= ns <= int(end_dt.value)
+        sel = np.flatnonzero(ok); sel = sel[np.argsort(ns[sel], kind="stable")]
+        x_ns = ns[sel]
+        Y = np.empty((sel.size, len(num_cols)), dtype=value_dtype(sel.size * len(num_cols) * 8), order="F")
+        for j, c in enumerate(num_cols): np.take(column(c), sel, out=Y[:, j])
+    return tcol, num_cols, x_ns, Y
+
+def prepare_table(path, start_dt=None, end_dt=None, progress=lambda pct: None):
+    # everything a load needs that does not touch Qt -> safe to run on a worker thread; progress(pct) per stage
+    delim, header = sniff_delimiter_quick(path)
+    tcol, num_cols, x_ns, Y_raw_mat = read_table(path, delim, start_dt, end_dt)
+    progress(40)
+
+    # valid rows & normalize — one (rows x series) column-major matrix, each series contiguous
+    valid_row, n_finite = finite_rows(Y_raw_mat)
+    n_valid = int(np.count_nonzero(valid_row))
+    all_finite = n_finite == n_valid   # per series: nothing to skip when drawing
+    if n_valid != valid_row.size:   # common case has no all-NaN rows: keep the arrays, no copy
+        x_ns = x_ns[valid_row]
+        Y_raw_mat = np.compress(valid_row, Y_raw_mat.T, axis=1).T   # via the transpose: stays Fortran order
+    x_sec = np.multiply(x_ns, 1e-9, dtype=np.float64)   # plot axis (s), derived once from the masked ns
+    # fixed sample period (exact, on the ns ints) -> nearest-sample lookups become one divide
+    step = int(x_ns[1] - x_ns[0]) if x_ns.size > 1 else 0
+    grid = (float(x_sec[0]), step * 1e-9) if step > 0 and bool((np.diff(x_ns) == step).all()) else None
+    stats = column_stats(Y_raw_mat, n_finite, all_finite)
+    progress(55)
+    # the first full-range draw needs the M4 pyramid of every long series: build it here, off the UI thread
+    Y_lin = linear_display(Y_raw_mat)
+    lod = ({('lin', c): m4_pyramid(Y_lin[:, j]) for j, c in enumerate(num_cols)}
+           if x_ns.size > LOD_MIN_BUCKET * LOD_MIN_BUCKETS else {})
+    progress(70)
+    return {'sniffed': {'path': path, 'delim': delim, 'header': header}, 'time_col': tcol, 'cols': num_cols,
+            'x_ns': x_ns, 'x_sec': x_sec, 'grid': grid, 'Y': Y_raw_mat, 'Y_lin': Y_lin, 'lod': lod, 'all_finite': all_finite,
+            'stats': stats}
+
+# ---------- CSV export: the Polars writer produces the same bytes as pandas.to_csv ----------
+# pandas writes a tz-aware time bare on whole seconds, else with 6 fraction digits (9 when finer than 1 us)
+def _pl_csv_times(name, x_ns):
+    ts = pl.Series(name, x_ns).cast(pl.Datetime("ns", "UTC")).dt.convert_time_zone("Asia/Seoul")
+    rem = x_ns % 1_000_000_000
+    kind = (rem != 0).astype(np.int8) + (rem % 1000 != 0)   # 0 whole second, 1 us, 2 ns
+    fmts = ["%Y-%m-%d %H:%M:%S%:z", "%Y-%m-%d %H:%M:%S%.6f%:z", "%Y-%m-%d %H:%M:%S%.9f%:z"]
+    used = np.unique(kind)
+    if used.size == 1: return ts.dt.strftime(fmts[used[0]])
+    k = pl.Series(kind)
+    return pl.select(pl.when(k == 0).then(ts.dt.strftime(fmts[0])).when(k == 1).then(ts.dt.strftime(fmts[1]))
+                     .otherwise(ts.dt.strftime(fmts[2])).alias(name)).to_series()
+
+# pandas writes a float cell as numpy's str(); Polars prints the same shortest digits, but positionally where
+# numpy switches to exponent notation (nonzero |v| < 1e-4, or >= 1e6 / 1e16 for float32 / float64) -> those cells
+# are rewritten from Polars' own text as d[.ddd]e±XX, in Polars string expressions (no per-cell Python)
+def _pl_csv_floats(name, y):
+    a = np.abs(y, dtype=np.float64)
+    sci = np.isfinite(a) & (a > 0) & ((a < 1e-4) | (a >= (1e6 if y.dtype == np.float32 else 1e16)))
+    s = pl.Series(name, y, nan_to_null=True)
+    if not sci.any(): return s
+    idx = np.flatnonzero(sci); out = s.cast(pl.Utf8)
+    t = out.gather(idx)
+    p = t.str.strip_prefix("-").str.split_exact("e", 1).struct.rename_fields(["m", "x"]).struct.unnest()
+    p = p.with_columns(neg=t.str.starts_with("-"), ip=pl.col("m").str.split_exact(".", 1).struct.field("field_0"),
+                       fp=pl.col("m").str.split_exact(".", 1).struct.field("field_1").fill_null(""))
+    p = p.with_columns(d=pl.concat_str(["ip", "fp"]).str.strip_chars_end("0"))   # shortest digits never end in 0
+    p = p.with_columns(sd=pl.col("d").str.strip_chars_start("0"))
+    p = p.select("neg", "sd", e=pl.col("x").cast(pl.Int64).fill_null(0) + pl.col("ip").str.len_chars().cast(pl.Int64) - 1
+                                - (pl.col("d").str.len_chars() - pl.col("sd").str.len_chars()).cast(pl.Int64))
+    txt = p.select(pl.concat_str([
+        pl.when("neg").then(pl.lit("-")).otherwise(pl.lit("")), pl.col("sd").str.slice(0, 1),
+        pl.when(pl.col("sd").str.len_chars() > 1).then(pl.concat_str([pl.lit("."), pl.col("sd").str.slice(1)])).otherwise(pl.lit("")),
+        pl.when(pl.col("e") < 0).then(pl.lit("e-")).otherwise(pl.lit("e+")), pl.col("e").abs().cast(pl.Utf8).str.zfill(2)]))
+    return out.scatter(idx, txt.to_series())
+
+# "Timestamp (KST)" + series {name: values}, NaN -> empty; Polars when installed (multi-threaded writer), else pandas
+def write_export_csv(path, x_ns, series, use_polars=HAS_POLARS):
+    if use_polars:
+        out = pl.DataFrame([_pl_csv_times("Timestamp (KST)", x_ns)] + [_pl_csv_floats(c, y) for c, y in series.items()])
+        out.write_csv(path, line_terminator=os.linesep)   # pandas' default line end
+    else:
+        data = {"Timestamp (KST)": pd.to_datetime(x_ns, utc=True).tz_convert(KST)}; data.update(series)
+        pd.DataFrame(data).to_csv(path, index=False)
 
 # ---------- Qt5/Qt6 호환: QDateTime -> python datetime ----------
 def _qdatetime_to_py(dt: QtCore.QDateTime):
@@ -94,6 +647,13 @@ def _qdatetime_to_py(dt: QtCore.QDateTime):
 
 # ---------- Centered ViewBox (Qt5/Qt6 wheel compat) ----------
 class CenteredViewBox(pg.ViewBox):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # a burst of wheel notches is folded into one setRange per 16 ms
+        self._zoom_pending = None    # [anchor, sx, sy]
+        self._zoom_timer = QtCore.QTimer(self); self._zoom_timer.setSingleShot(True); self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._flush_zoom)
+
     def wheelEvent(self, ev):
         # wheel delta compat
         def _delta(e):
@@ -121,21 +681,84 @@ class CenteredViewBox(pg.ViewBox):
 
         mods = ev.modifiers() if hasattr(ev, "modifiers") else QtCore.Qt.KeyboardModifier.NoModifier
         if mods & QtCore.Qt.KeyboardModifier.ControlModifier:
-            self._zoom_around(anchor, 1.0, s)   # Y only
+            self._queue_zoom(anchor, 1.0, s)   # Y only
         elif mods & QtCore.Qt.KeyboardModifier.ShiftModifier:
-            self._zoom_around(anchor, s, 1.0)   # X only
+            self._queue_zoom(anchor, s, 1.0)   # X only
         else:
-            self._zoom_around(anchor, s, s)     # XY
+            self._queue_zoom(anchor, s, s)     # XY
         ev.accept()
 
+    def _queue_zoom(self, anchor, sx, sy):
+        p = self._zoom_pending
+        if p is None:
+            self._zoom_pending = [anchor, sx, sy]; self._zoom_timer.start()
+        else:
+            p[0] = anchor; p[1] *= sx; p[2] *= sy
+
+    def _flush_zoom(self):
+        if self._zoom_pending is None: return
+        anchor, sx, sy = self._zoom_pending; self._zoom_pending = None
+        self._zoom_around(anchor, sx, sy)
+
     def _zoom_around(self, anchor, sx, sy):
-        xr, yr = self.viewRange()
+        (x0, x1), (y0, y1) = self.state['viewRange']    # read in place; viewRange() copies
         ax, ay = anchor.x(), anchor.y()
-        x0, x1 = xr; y0, y1 = yr
         nx0 = ax - (ax - x0)*sx; nx1 = ax + (x1 - ax)*sx
         ny0 = ay - (ay - y0)*sy; ny1 = ay + (y1 - ay)*sy
         self.setRange(xRange=(nx0, nx1), yRange=(ny0, ny1), padding=0.0)
 
+# ---------- DateAxisItem with memoized tick labels ----------
+class CachedDateAxisItem(pg.DateAxisItem):
+    # pan / zoom repaints ask for the same few tick values again and again: strftime each one once per format
+    MAX_LABELS = 4096
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._labels = {}   # {(zoomLevel, spacing, scale): {value: label}}
+
+    def tickStrings(self, values, scale, spacing):
+        memo = self._labels.setdefault((self.zoomLevel, spacing, scale), {})
+        miss = [v for v in values if v not in memo]
+        if miss:
+            if len(memo) + len(miss) > self.MAX_LABELS: memo.clear()
+            memo.update(zip(miss, super().tickStrings(miss, scale, spacing)))
+        return [memo[v] for v in values]
+
+# ---------- PlotDataItem with throttled view-range updates ----------
+class ThrottledPlotDataItem(pg.PlotDataItem):
+    # clip-to-view / auto-downsampling re-run at most once per 50 ms while zooming or panning
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._range_timer = QtCore.QTimer(self); self._range_timer.setSingleShot(True); self._range_timer.setInterval(50)
+        self._range_timer.timeout.connect(lambda: pg.PlotDataItem.viewRangeChanged(self))
+
+    def viewRangeChanged(self, vb=None, ranges=None, changed=None):
+        if not self._range_timer.isActive(): self._range_timer.start()
+
+    def set_markers(self, brush):
+        if brush is None: self.setSymbol(None); return
+        # one style update with a single shared brush instead of three setters -> one scatter rebuild, atlas hits
+        self.opts.update(symbolSize=3, symbolBrush=brush)
+        self.setSymbol('o')
+
+# ---------- background task: fn(*args) on the global pool, result delivered on the GUI thread ----------
+class TaskSignals(QtCore.QObject):
+    done = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(str)
+    progress = QtCore.pyqtSignal(int)
+
+class Task(QtCore.QRunnable):
+    # fn(*args, progress=callback): the callback may be called from the worker with a percentage
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn; self.args = args
+        self.signals = TaskSignals()   # created on the GUI thread -> queued delivery there
+
+    def run(self):
+        try: res = self.fn(*self.args, progress=self.signals.progress.emit)
+        except Exception as e: self.signals.failed.emit(str(e)); return
+        self.signals.done.emit(res)
+
 # ---------- per-series Condition dialog ----------
 class ConditionDialog(QtWidgets.QDialog):
     def __init__(self, series_name, parent=None, preset=None):
@@ -177,19 +800,38 @@ class DASH(QtWidgets.QMainWindow):
         self.series_cols = []
         self.time_col = TIME_COL
         self.x_sec = None; self.x_ns = None
-        self.Y_raw = {}; self.Y_norm = {}
+        self._x_grid = None                        # (t0, dt) in s when x_sec is uniformly sampled
+        self._last_bracket = 0                     # searchsorted result of the last _nearest_index
+        self.Y_raw = {}; self.Y_norm = None        # {col: view into Y_raw_mat / Y_norm_mat}; norm is lazy
+        self.Y_raw_mat = None; self.Y_norm_mat = None
+        self.col_index = {}                        # {col: column in *_mat}
+        self.stats = {}                            # {col: column_stats() entry}, filled once per load
+        self._lod = {}                             # {('lin'|'log', col): m4_pyramid levels}; lin prebuilt by long loads
+        self.Y_disp_mat = {}                       # {mode: matrix drawn in that Y-scale mode}
+        self._hover_fmt = {}
+        self._sniffed = None                       # {'path','delim','header'} from the last load
+        self._skipped_cols = []                    # non-numeric header columns of the last load
+        self._loading = False; self._load_task = None   # background parse in flight (one at a time)
+        self._load_queued = False                  # a load requested while one was in flight: runs next
+        self._jit_task = None                      # numba warm-up in flight (warm_jit_async)
+        self.all_finite = {}                       # {col: no NaN/Inf after row filtering}
         self.curves = {}
 
         # state
         self.current_mode = "linear"
         self.markers_on = True
 
+        # shared QPen / QBrush objects keyed by (rgba, width, style) / rgba
+        self._pen_cache = {}; self._brush_cache = {}
+
         # per-series downsampling flags + global default
         self.ds_for = {}
         self.ds_default = True
+        self.ds_method = 'peak'     # 'peak' | 'subsample'
 
         # Active/Inactive
         self.active_for = {}
+        self._active_cache = []            # active series in active_for order, refreshed on every toggle
 
         # new states
         self.thresholds = {}        # {col: [{'op':'=','value':float,'line':item,'label':item}]}
@@ -217,16 +859,21 @@ class DASH(QtWidgets.QMainWindow):
         self.end_date   = QtWidgets.QDateEdit(calendarPopup=True); self.end_date.setDisplayFormat("yyyy-MM-dd")
         self.end_time   = QtWidgets.QTimeEdit(); self.end_time.setDisplayFormat("HH:mm:ss")
         self.chk_full   = QtWidgets.QCheckBox("Full Range"); self.chk_full.setChecked(True)
-        btn_load = QtWidgets.QPushButton("Load"); btn_load.clicked.connect(self.load_and_plot)
+        self.btn_load = btn_load = QtWidgets.QPushButton("Load"); btn_load.clicked.connect(self.load_and_plot)
 
         btn_help = QtWidgets.QPushButton("?"); btn_help.setToolTip("Shortcuts Help"); btn_help.clicked.connect(self.show_help)
         self.btn_ds_global = QtWidgets.QPushButton("Downsampling: ON")
         self.btn_ds_global.setCheckable(True); self.btn_ds_global.setChecked(True)
         self.btn_ds_global.clicked.connect(self.toggle_ds_global)
+        self.cmb_ds_method = QtWidgets.QComboBox(); self.cmb_ds_method.addItems(["peak", "subsample"])
+        self.cmb_ds_method.setToolTip("Downsampling method"); self.cmb_ds_method.currentTextChanged.connect(self.on_ds_method_changed)
 
         # new: Compare & Highlight
         self.btn_compare = QtWidgets.QPushButton("Compare: OFF"); self.btn_compare.setCheckable(True); self.btn_compare.clicked.connect(self.toggle_compare_mode)
         self.btn_open_ref = QtWidgets.QPushButton("Open Ref"); self.btn_open_ref.clicked.connect(self.open_compare_file); self.btn_open_ref.setEnabled(False)
+        self.btn_gl = QtWidgets.QPushButton(f"GL: {'ON' if USE_OPENGL else 'OFF'}"); self.btn_gl.setCheckable(True)
+        self.btn_gl.setChecked(USE_OPENGL); self.btn_gl.setEnabled(HAS_OPENGL); self.btn_gl.clicked.connect(self.toggle_gl)
+        self.btn_gl.setToolTip("OpenGL rendering (software GL unless started with DASH_OPENGL=1)")
         self.btn_highlight = QtWidgets.QPushButton("Highlight: OFF"); self.btn_highlight.setCheckable(True); self.btn_highlight.clicked.connect(self.toggle_highlight_mode)
 
         topbar.addWidget(QtWidgets.QLabel("File")); topbar.addWidget(self.path_edit, 1); topbar.addWidget(btn_browse)
@@ -235,7 +882,7 @@ class DASH(QtWidgets.QMainWindow):
         topbar.addSpacing(6)
         topbar.addWidget(QtWidgets.QLabel("End"));   topbar.addWidget(self.end_date);   topbar.addWidget(self.end_time)
         topbar.addSpacing(8); topbar.addWidget(self.chk_full); topbar.addSpacing(8); topbar.addWidget(btn_load)
-        topbar.addSpacing(10); topbar.addWidget(self.btn_ds_global)
+        topbar.addSpacing(10); topbar.addWidget(self.btn_ds_global); topbar.addWidget(self.cmb_ds_method); topbar.addWidget(self.btn_gl)
         topbar.addSpacing(10); topbar.addWidget(self.btn_compare); topbar.addWidget(self.btn_open_ref)
         topbar.addSpacing(10); topbar.addWidget(self.btn_highlight); topbar.addWidget(btn_help)
 
@@ -294,24 +941,37 @@ class DASH(QtWidgets.QMainWindow):
         self.list_bm.itemDoubleClicked.connect(lambda it: self.jump_bookmark())
 
         # Plot (CenteredViewBox)
-        axis = pg.DateAxisItem(utcOffset=9*3600)
+        axis = CachedDateAxisItem(utcOffset=9*3600)
         self.viewbox = CenteredViewBox()
         self.plot = pg.PlotWidget(viewBox=self.viewbox, axisItems={'bottom': axis})
         self.plot.setBackground('w'); self.plot.showGrid(x=True, y=True, alpha=0.2)
         self.plot.enableAutoRange(x=False, y=False)
-        self.plot.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
-        self.plot.setCacheMode(QtWidgets.QGraphicsView.CacheModeFlag.CacheNone)
+        # repaint only dirty regions (crosshair/overlays are pg items that report geometry changes); keep the
+        # cached background GraphicsView sets up
+        self.plot.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+        self.plot.setCacheMode(QtWidgets.QGraphicsView.CacheModeFlag.CacheBackground)
         self.plot.setRenderHints(QtGui.QPainter.RenderHint.Antialiasing | QtGui.QPainter.RenderHint.TextAntialiasing)
         self.view = self.plot.getPlotItem().vb
         self._set_min_ranges()
 
         # crosshair + hover readout
         self.vline = pg.InfiniteLine(angle=90, movable=False,
-                                     pen=pg.mkPen((100,100,100,120), width=1, style=QtCore.Qt.PenStyle.DashLine))
-        self.plot.addItem(self.vline)
+                                     pen=self._pen_for((100,100,100,120), 1, QtCore.Qt.PenStyle.DashLine))
+        self.plot.addItem(self.vline, ignoreBounds=True)   # crosshair must not pull x=0 into autoRange
+        self._hover_pos = None; self._hover_key = None; self._hover_msg = ""
+        self._plot_rect = None   # plot item's scene rect for hover/click hit tests; dropped whenever its geometry changes
+        self.plot.plotItem.geometryChanged.connect(lambda: setattr(self, '_plot_rect', None))
+        self._hover_timer = QtCore.QTimer(self); self._hover_timer.setSingleShot(True); self._hover_timer.setInterval(50)
+        self._hover_timer.timeout.connect(self._update_hover)
         self.plot.scene().sigMouseMoved.connect(self.on_mouse_moved)
         self.plot.scene().sigMouseClicked.connect(self.on_plot_clicked)
 
+        # level-of-detail re-slice: at most once per 50 ms while panning / zooming / resizing
+        self._lod_timer = QtCore.QTimer(self); self._lod_timer.setSingleShot(True); self._lod_timer.setInterval(50)
+        self._lod_timer.timeout.connect(self._refresh_lod)
+        self.viewbox.sigXRangeChanged.connect(self._queue_lod)
+        self.viewbox.sigResized.connect(self._queue_lod)
+
         # Right panel
         right = QtWidgets.QWidget(); right_v = QtWidgets.QVBoxLayout(right); right_v.setContentsMargins(6,6,6,6); right_v.setSpacing(8)
 
@@ -398,7 +1058,7 @@ class DASH(QtWidgets.QMainWindow):
 
         # pens
         self.pen_active_cache = {}
-        self.pen_inactive = pg.mkPen((150,150,150,120), width=1.0)
+        self.pen_inactive = self._pen_for((150,150,150,120), 1.0)
         self.opacity_active = 1.0
         self.opacity_inactive = 0.20
 
@@ -418,6 +1078,18 @@ class DASH(QtWidgets.QMainWindow):
         try: self.view.setLimits(minXRange=1.0, minYRange=1e-6)
         except Exception: pass
 
+    def _pen_for(self, color, width=1.0, style=QtCore.Qt.PenStyle.SolidLine):
+        rgba = pg.mkColor(color).getRgb(); key = (rgba, float(width), style)
+        pen = self._pen_cache.get(key)
+        if pen is None: pen = self._pen_cache[key] = pg.mkPen(rgba, width=width, style=style)
+        return pen
+
+    def _brush_for(self, color):
+        rgba = pg.mkColor(color).getRgb()
+        br = self._brush_cache.get(rgba)
+        if br is None: br = self._brush_cache[rgba] = pg.mkBrush(rgba)
+        return br
+
     def set_scale(self, mode):
         if mode == "linear": self.rb_linear.setChecked(True)
         elif mode == "log":  self.rb_log.setChecked(True)
@@ -430,7 +1102,23 @@ class DASH(QtWidgets.QMainWindow):
         if path: self.path_edit.setText(path)
 
     # ------------ load + plot ------------
+    # numba warm-up off the GUI thread: import on the pool, start the parallel layer here, compile on the pool
+    def warm_jit_async(self):
+        if not HAS_NUMBA: return
+        task = Task(lambda progress: _jit_ready())
+        task.signals.done.connect(self._on_numba_imported)
+        self._jit_task = task; QtCore.QThreadPool.globalInstance().start(task)
+
+    def _on_numba_imported(self, ok):
+        if not ok: self._jit_task = None; return   # numba failed to import: NumPy kernels from here on
+        launch_jit_threads()
+        task = Task(lambda progress: warm_jit())
+        task.signals.done.connect(lambda _: setattr(self, '_jit_task', None))
+        self._jit_task = task; QtCore.QThreadPool.globalInstance().start(task)
+
     def load_and_plot(self):
+        if self._loading:   # one parse at a time: rerun once it lands, with whatever path_edit holds then
+            self._load_queued = True; self.status.showMessage("Loading... (next load queued)"); return
         path = self.path_edit.text().strip()
         if not path:
             QtWidgets.QMessageBox.warning(self, "Notice", "Please select a data file."); return
@@ -447,98 +1135,84 @@ class DASH(QtWidgets.QMainWindow):
             except Exception as e:
                 QtWidgets.QMessageBox.critical(self, "Time Error", f"Failed to parse time: {e}"); return
 
-        self.progress.setVisible(True); self.progress.setValue(5); self.status.showMessage("Loading...")
-        QtWidgets.QApplication.processEvents()
-
-        try:
-            self._read_and_prepare(path, start_dt, end_dt)
-            self.progress.setValue(60); QtWidgets.QApplication.processEvents()
-        except Exception as e:
-            self.progress.setVisible(False); self.status.showMessage("Error")
-            QtWidgets.QMessageBox.critical(self, "Load Error", str(e)); return
-
+        # parse on the thread pool; the UI stays live behind a busy bar until _on_loaded / _on_load_failed
+        self._loading = True; self.btn_load.setEnabled(False)
+        self.progress.setRange(0, 0); self.progress.setVisible(True); self.status.showMessage("Loading...")
+        launch_jit_threads()   # no-op after startup; prepare_table may run (and compile) parallel kernels
+        task = Task(prepare_table, path, start_dt, end_dt)
+        task.signals.done.connect(self._on_loaded); task.signals.failed.connect(self._on_load_failed)
+        task.signals.progress.connect(self._on_load_progress)
+        self._load_task = task   # keep the signal object alive until delivery
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _load_finished(self):
+        self._loading = False; self._load_task = None; self.btn_load.setEnabled(True)
+        self.progress.setRange(0, 100)
+
+    def _run_queued_load(self):
+        if self._load_queued: self._load_queued = False; QtCore.QTimer.singleShot(0, self.load_and_plot)
+
+    def _on_load_failed(self, msg):
+        self._load_finished()
+        self.progress.setVisible(False); self.status.showMessage("Error")
+        QtWidgets.QMessageBox.critical(self, "Load Error", msg)
+        self._run_queued_load()
+
+    def _on_load_progress(self, pct):
+        # busy while the reader runs, then a real bar through the post-processing stages
+        if self._loading: self.progress.setRange(0, 100); self.progress.setValue(pct)
+
+    def _on_loaded(self, res):
+        self._load_finished()
+        self.progress.setValue(75)
+        self._apply_loaded(res)
         self._plot_all()
-        self.progress.setValue(90); QtWidgets.QApplication.processEvents()
+        self.progress.setValue(90)
         self._fit_view()
         self.progress.setValue(100)
-        QtCore.QTimer.singleShot(250, lambda: (self.progress.setVisible(False), self.status.showMessage(
-            f"Loaded: {os.path.basename(self.path_edit.text())} / series={len(self.series_cols)} / points={len(self.x_sec)} / time={self.time_col}")))
-
-    def _read_and_prepare(self, path, start_dt, end_dt):
-        delim = sniff_delimiter_quick(path)
-        if HAS_POLARS:
-            df = pl.read_csv(path, infer_schema_length=10000, has_header=True) if delim is None else \
-                 pl.read_csv(path, infer_schema_length=10000, separator=delim, has_header=True)
-            tcol = next((c for c in TIME_COL_CANDIDATES if c in df.columns), df.columns[0])
-            self.time_col = tcol
-            ts_expr = pl.col(self.time_col).str.strptime(pl.Datetime, strict=False, exact=False)
-            df = df.with_columns([ts_expr.alias("_ts_").dt.replace_time_zone("UTC").dt.convert_time_zone("Asia/Seoul")]) \
-                   .drop_nulls(["_ts_"]).sort("_ts_")
-            if start_dt or end_dt:
-                sdt = start_dt.to_pydatetime() if start_dt is not None else None
-                edt = end_dt.to_pydatetime()   if end_dt   is not None else None
-                if sdt and edt: df = df.filter((pl.col("_ts_") >= sdt) & (pl.col("_ts_") <= edt))
-                elif sdt:       df = df.filter(pl.col("_ts_") >= sdt)
-                elif edt:       df = df.filter(pl.col("_ts_") <= edt)
-            num_cols = [c for c, dt in zip(df.columns, df.dtypes) if c not in (self.time_col, "_ts_") and is_numeric_polars_dtype(dt)]
-            if not num_cols: raise ValueError("No numeric series to plot.")
-            x_ns  = df["_ts_"].dt.timestamp("ns").to_numpy().astype("int64", copy=False)
-            x_sec = x_ns.astype("float64") / 1e9
-            Y_raw = {col: df[col].to_numpy().astype("float64", copy=False) for col in num_cols}
-        else:
-            df = pd.read_csv(path, sep=delim) if delim is not None else pd.read_csv(path, sep=None, engine="python")
-            tcol = next((c for c in TIME_COL_CANDIDATES if c in df.columns), df.columns[0])
-            self.time_col = tcol
-            ts = pd.to_datetime(df[self.time_col], errors="coerce").dt.tz_localize("UTC").dt.tz_convert(KST)
-            df = df.assign(_ts_=ts).dropna(subset=["_ts_"]).sort_values("_ts_")
-            if start_dt or end_dt:
-                sdt = start_dt if start_dt is not None else df["_ts_"].min()
-                edt = end_dt   if end_dt   is not None else df["_ts_"].max()
-                df = df[(df["_ts_"] >= sdt) & (df["_ts_"] <= edt)]
-            num_cols = [c for c in df.columns if c not in (self.time_col, "_ts_") and pd.api.types.is_numeric_dtype(df[c])]
-            if not num_cols: raise ValueError("No numeric series to plot.")
-            x_ns  = df["_ts_"].view("int64").to_numpy()
-            x_sec = x_ns.astype("float64") / 1e9
-            Y_raw = {col: pd.to_numeric(df[col], errors='coerce').to_numpy(dtype="float64", copy=False) for col in num_cols}
-
-        # normalize & valid rows
-        Y_norm = {}
-        for col, y in Y_raw.items():
-            ymin = np.nanmin(y); ymax = np.nanmax(y)
-            Y_norm[col] = (y - ymin) / (ymax - ymin) if np.isfinite(ymin) and np.isfinite(ymax) and ymax > ymin else np.zeros_like(y)
-
-        if num_cols:
-            finite_mask = np.vstack([np.isfinite(Y_raw[c]) for c in num_cols])
-            valid_row = finite_mask.any(axis=0)
-        else:
-            valid_row = np.array([], dtype=bool)
+        msg = (f"Loaded: {os.path.basename(res['sniffed']['path'])} / series={len(self.series_cols)} "
+               f"/ points={len(self.x_sec)} / time={self.time_col}")   # the file parsed, not path_edit's current text
+        QtCore.QTimer.singleShot(250, lambda: self._loading or (self.progress.setVisible(False), self.status.showMessage(msg)))
+        self._run_queued_load()
+
+    def _apply_loaded(self, res):
+        self._sniffed = res['sniffed']; self.time_col = res['time_col']
+        num_cols = res['cols']; x_ns = res['x_ns']; Y_raw_mat = res['Y']; all_finite = res['all_finite']
 
-        x_ns = x_ns[valid_row]; x_sec = x_sec[valid_row]
-        for c in list(Y_raw.keys()):
-            Y_raw[c]  = Y_raw[c][valid_row]; Y_norm[c] = Y_norm[c][valid_row]
+        # log / normalize matrices are built on first use (_display_mat); most sessions stay linear
+        self.Y_disp_mat = {'linear': res['Y_lin']}
 
         self.series_cols = num_cols
-        self.x_ns = x_ns; self.x_sec = x_sec
-        self.Y_raw = Y_raw; self.Y_norm = Y_norm
+        self.col_index = {c: j for j, c in enumerate(num_cols)}
+        self.all_finite = {c: bool(all_finite[j]) for c, j in self.col_index.items()}
+        self.stats = dict(zip(num_cols, res['stats']))
+        # hover readout fragments: ("name: ", " unit")
+        units = [unit_from_name(c) for c in num_cols]
+        self._hover_fmt = {c: (f"{c}: ", f" {u}" if u else "") for c, u in zip(num_cols, units)}
+        self.x_ns = x_ns; self.x_sec = res['x_sec']; self._x_grid = res['grid']; self._last_bracket = 0
+        self.Y_raw_mat = Y_raw_mat; self.Y_norm_mat = None
+        # per-series views into the matrices (no copies)
+        self.Y_raw  = {c: Y_raw_mat[:, j]  for c, j in self.col_index.items()}
+        self.Y_norm = None
 
         # init states / clear overlays
         self.ds_for = {c: self.ds_default for c in self.series_cols}
-        self.active_for = {}
+        self._lod = res['lod']
+        self.active_for = {}; self._active_cache = []; self._hover_key = None
         self.thresholds = {}
         self.find_rules = {}
         self.event_items.clear()
         self.highlight_regions.clear()
         self.compare_data = None; self.curves_ref.clear()
 
-        self._maybe_show_time_selector(path, delim)
+        # header columns that were not plotted (text / mixed) -> listed in the info panel instead of loaded
+        hdr = self._sniffed['header'] if self._sniffed else []
+        self._skipped_cols = [h for h in hdr if h and h != self.time_col and h not in self.col_index]
 
-    def _maybe_show_time_selector(self, path, delim):
-        try:
-            hdr = (pd.read_csv(path, nrows=0, sep=None, engine="python").columns.tolist()
-                   if delim is None else
-                   [h.strip() for h in open(path, 'r', encoding='utf-8', errors='ignore').readline().strip().split(delim)])
-        except Exception:
-            hdr = []
+        self._maybe_show_time_selector()
+
+    def _maybe_show_time_selector(self):
+        hdr = self._sniffed['header'] if self._sniffed else []
         cands = [h for h in hdr if h in TIME_COL_CANDIDATES]
         if cands and self.time_col in cands and len(cands) > 1:
             self.cmb_time_col.clear(); self.cmb_time_col.addItems(cands)
@@ -560,26 +1234,28 @@ class DASH(QtWidgets.QMainWindow):
         self._fit_view()
         self._set_min_ranges()
 
+    def _display_mat(self, mode):
+        mat = self.Y_disp_mat.get(mode)
+        if mat is None:
+            if mode == 'normalize':
+                mat = self.Y_norm_mat = normalize_columns(self.Y_raw_mat)
+                self.Y_norm = {c: mat[:, j] for c, j in self.col_index.items()}
+            else:
+                mat = log_display(self.Y_raw_mat)
+            self.Y_disp_mat[mode] = mat
+        return mat
+
     def _update_curves_for_mode(self):
+        log = self.current_mode == "log"
         for col, cv in self.curves.items():
-            y = self.Y_raw[col]
-            if self.current_mode == "normalize":
-                y_disp = self.Y_norm[col]; connect_mode = 'all'
-            elif self.current_mode == "log":
-                y_disp = np.where(np.isfinite(y) & (np.abs(y) > 0), np.abs(y), np.nan); connect_mode = 'finite'
-            else:
-                y_disp = np.where(np.isfinite(y), y, np.nan); connect_mode = 'all'
-            try: cv.setData(self.x_sec, y_disp, connect=connect_mode)
-            except Exception: cv.setData(self.x_sec, y_disp)
-            try:
-                cv.setClipToView(self.ds_for.get(col, self.ds_default))
-                cv.setDownsampling(auto=self.ds_for.get(col, self.ds_default))
-            except Exception: pass
+            skip = (not log) and self.all_finite.get(col, False)   # sanitized arrays: let pyqtgraph skip its finite scan
+            cv.opts['connect'] = 'all' if skip else 'finite'; cv.opts['skipFiniteCheck'] = skip   # applied by the setData below
+            self._apply_downsampling(col, cv)
             self._apply_symbol(cv)
         self._dump_diagnostics(include_original_range=(self.current_mode=="normalize"))
 
     def _update_left_axis_label(self):
-        visible_active = [c for c, a in self.active_for.items() if a]
+        visible_active = self._active_cache
         ax = self.plot.getAxis('left')
         if self.current_mode == "normalize":
             ax.setLabel(text="Normalized"); return
@@ -595,9 +1271,16 @@ class DASH(QtWidgets.QMainWindow):
     def _fit_view(self):
         if self.x_sec is None or len(self.x_sec) == 0: return
         pi = self.plot.getPlotItem(); vb = pi.vb
-        self.plot.enableAutoRange(x=True, y=True)
-        try: pi.autoRange()
-        finally: self.plot.enableAutoRange(x=False, y=False)
+        for col, cv in self.curves.items():   # whole series on screen; hidden curves re-slice when shown
+            if cv.isVisible(): self._apply_downsampling(col, cv, full=True)
+            else: cv._lod_key = None
+        yb = self._fit_y_bounds()
+        if yb is not None:   # same auto padding as autoRange, without walking every item's data
+            vb.setRange(xRange=(float(self.x_sec[0]), float(self.x_sec[-1])), yRange=yb)
+        else:
+            self.plot.enableAutoRange(x=True, y=True)
+            try: pi.autoRange()
+            finally: self.plot.enableAutoRange(x=False, y=False)
         try:
             xr, yr = vb.viewRange()
             pad_x = 0.02 * (xr[1] - xr[0]) if xr[1] > xr[0] else 0.0
@@ -610,10 +1293,21 @@ class DASH(QtWidgets.QMainWindow):
         except Exception:
             pass
 
+    # y extent of the active series from the load-time stats (linear / normalize); None -> ask the items
+    def _fit_y_bounds(self):
+        if self.current_mode == "log" or any(cv.isVisible() for cv in self.curves_ref.values()): return None
+        st = [d for d in (self.stats[c] for c in self._active_cache) if d['n_finite']]
+        if not st: return None
+        if self.current_mode == "normalize": return 0.0, (1.0 if any(d['ymax'] > d['ymin'] for d in st) else 0.0)
+        return min(d['ymin'] for d in st), max(d['ymax'] for d in st)
+
     # ------------ plot all ------------
     def _plot_all(self):
-        self.plot.clear(); self.plot.addItem(self.vline)
-        self.plot.setAxisItems({'bottom': pg.DateAxisItem(utcOffset=9*3600)})
+        # curves of columns that survive a reload keep their item (new data via setData); everything else goes
+        pi = self.plot.getPlotItem(); pi.disableAutoRange()
+        keep = {c: cv for c, cv in self.curves.items() if c in self.col_index}; kept = {id(cv) for cv in keep.values()}
+        for item in pi.items[:]:
+            if item is not self.vline and id(item) not in kept: pi.removeItem(item)
         self.curves.clear()
         self.list_series.clear()
         self.list_events.clear()
@@ -622,29 +1316,41 @@ class DASH(QtWidgets.QMainWindow):
         if not self.series_cols:
             self.info.setPlainText("No numeric series."); return
 
-        scores = {}
-        for c in self.series_cols:
-            y = self.Y_raw[c]; fin = y[np.isfinite(y)]
-            scores[c] = -np.inf if fin.size==0 else 0.7*np.nanstd(fin) + 0.3*np.nanmax(np.abs(fin))
-        ordered = sorted(self.series_cols, key=lambda c: scores[c], reverse=True)
+        # busiest series first: 0.7*std + 0.3*|max| from the load-time stats, one vectorized pass
+        st = [self.stats[c] for c in self.series_cols]
+        scores = 0.7*np.array([d['std'] for d in st]) + 0.3*np.array([d['absmax'] for d in st])
+        scores[np.array([d['n_finite'] == 0 for d in st])] = -np.inf
+        ordered = [self.series_cols[j] for j in np.argsort(-scores, kind='stable')]
 
         for i, col in enumerate(ordered):
-            self.pen_active_cache[col] = pg.mkPen(pg.intColor(i, hues=max(8, len(ordered)), maxValue=255), width=2.2)
+            self.pen_active_cache[col] = self._pen_for(pg.intColor(i, hues=max(8, len(ordered)), maxValue=255), 2.2)
 
+        # batch build: no repaint, no auto-range and no per-curve legend entry until every curve is in
         init_show_n = min(6, len(ordered))
-        for i, col in enumerate(ordered):
-            cv = self.plot.plot(self.x_sec, self.Y_raw[col], name=col, pen=self.pen_active_cache[col])
-            self.curves[col] = cv
-            try:
-                cv.setClipToView(self.ds_for.get(col, self.ds_default))
-                cv.setDownsampling(auto=self.ds_for.get(col, self.ds_default))
-            except Exception: pass
-            self._apply_symbol(cv)
-            self.active_for[col] = (i < init_show_n)
-
-            it = QtWidgets.QListWidgetItem(col)
-            it.setToolTip("Right-click: Conditions / Threshold / Color / Downsampling")
-            self.list_series.addItem(it)
+        legend, pi.legend = pi.legend, None          # rebuilt once by _refresh_legend below
+        self.plot.setUpdatesEnabled(False)
+        try:
+            for i, col in enumerate(ordered):
+                self.active_for[col] = (i < init_show_n)
+                cv = keep.get(col); skip = self.all_finite.get(col, False)
+                # explicit connect: pyqtgraph's default 'auto' turns into 'finite' + finite scan on the first setData
+                if cv is None:
+                    cv = ThrottledPlotDataItem(name=col, pen=self.pen_active_cache[col], connect='all' if skip else 'finite',
+                                               skipFiniteCheck=skip)
+                    pi.addItem(cv)
+                else:
+                    cv.opts['connect'] = 'all' if skip else 'finite'; cv.opts['skipFiniteCheck'] = skip   # back to linear
+                cv.setVisible(self.active_for[col])
+                self.curves[col] = cv
+                self._apply_downsampling(col, cv)   # data goes in after addItem: needs the ViewBox
+                self._apply_symbol(cv)
+
+                it = QtWidgets.QListWidgetItem(col)
+                it.setToolTip("Right-click: Conditions / Threshold / Color / Downsampling")
+                self.list_series.addItem(it)
+        finally:
+            pi.legend = legend
+            self.plot.setUpdatesEnabled(True)
 
         self._apply_active_styles_to_curves_and_list()
         try: self.plot.addLegend(offset=(0,0))
@@ -659,57 +1365,73 @@ class DASH(QtWidgets.QMainWindow):
             self._enable_jump_controls(int(np.nanmin(self.x_ns)), int(np.nanmax(self.x_ns)))
 
         self.status.showMessage(
-            f"Loaded: {os.path.basename(self.path_edit.text())} / series={len(self.series_cols)} "
+            f"Loaded: {os.path.basename(self._sniffed['path'])} / series={len(self.series_cols)} "
             f"/ points={len(self.x_sec)} / time={self.time_col}"
         )
 
     # ------------ active/inactive handling ------------
-    def _apply_active_styles_to_curves_and_list(self):
-        for col, cv in self.curves.items():
+    def _apply_active_styles_to_curves_and_list(self, only=None):
+        # only=col: restyle just that curve / list row (single click toggles)
+        curves = self.curves.items() if only is None else [(only, self.curves[only])]
+        for col, cv in curves:
             if self.active_for.get(col, True):
-                cv.show()
-                cv.setPen(self.pen_active_cache[col])
+                cv.show()   # stale LOD of a curve hidden during a zoom: re-sliced by the _fit_view every caller runs next
+                pen = self.pen_active_cache[col]
+                if getattr(cv, '_pen', None) is not pen: cv.setPen(pen); cv._pen = pen   # setPen re-bounds the curve
                 try: cv.setOpacity(self.opacity_active)
                 except Exception: pass
             else:
                 cv.hide()
-        for i in range(self.list_series.count()):
-            it = self.list_series.item(i)
-            col = it.text()
-            it.setForeground(QtGui.QBrush(QtGui.QColor(20,20,20) if self.active_for.get(col, True) else QtGui.QColor(140,140,140)))
+        self._active_cache = [c for c, a in self.active_for.items() if a]   # read by hover / click / export
+        br_on = self._brush_for((20,20,20)); br_off = self._brush_for((140,140,140))   # shared, not one pair per item
+        items = (self.list_series.item(i) for i in range(self.list_series.count())) if only is None else \
+                self.list_series.findItems(only, QtCore.Qt.MatchFlag.MatchExactly)
+        for it in items:
+            it.setForeground(br_on if self.active_for.get(it.text(), True) else br_off)
         self._refresh_legend()
 
     def on_item_clicked(self, item: QtWidgets.QListWidgetItem):
         col = item.text()
         self.active_for[col] = not self.active_for.get(col, True)
-        self._apply_active_styles_to_curves_and_list()
+        self._apply_active_styles_to_curves_and_list(only=col)
         self._update_left_axis_label()
         self._fit_view()
 
+    def _set_active(self, pred):
+        # bulk toggle: restyle, legend diff and fit in one pass, one repaint at the end
+        for c in self.series_cols: self.active_for[c] = pred(c)
+        self.plot.setUpdatesEnabled(False)
+        try: self._apply_active_styles_to_curves_and_list(); self._update_left_axis_label(); self._fit_view()
+        finally: self.plot.setUpdatesEnabled(True)
+
     def select_all_on(self):
-        for c in self.series_cols: self.active_for[c] = True
-        self._apply_active_styles_to_curves_and_list(); self._update_left_axis_label(); self._fit_view()
+        self._set_active(lambda c: True)
 
     def select_all_off(self):
-        for c in self.series_cols: self.active_for[c] = False
-        self._apply_active_styles_to_curves_and_list(); self._update_left_axis_label(); self._fit_view()
+        self._set_active(lambda c: False)
 
     def select_invert(self):
-        for c in self.series_cols: self.active_for[c] = not self.active_for.get(c, True)
-        self._apply_active_styles_to_curves_and_list(); self._update_left_axis_label(); self._fit_view()
+        self._set_active(lambda c: not self.active_for.get(c, True))
 
     def _refresh_legend(self):
         leg = self.plot.plotItem.legend
         if leg is None:
             try: self.plot.addLegend(offset=(0,0)); leg = self.plot.plotItem.legend
             except Exception: return
-        leg.clear()
-        for col, cv in self.curves.items():
-            if self.active_for.get(col, True):
-                try: leg.addItem(cv, col)
-                except Exception: pass
-        for col, cv in self.curves_ref.items():
-            try: leg.addItem(cv, f"{col} (ref)")
+        # diff against what the legend already shows: hidden curves are removed, entries before the first
+        # newly shown one stay, the rest is re-added -> legend order always follows curve order
+        want = [(cv, col) for col, cv in self.curves.items() if self.active_for.get(col, True)] + \
+               [(cv, f"{col} (ref)") for col, cv in self.curves_ref.items()]
+        want_ids = {id(cv) for cv, _ in want}
+        for sample, _ in leg.items[:]:
+            if id(sample.item) not in want_ids: leg.removeItem(sample.item)
+        keep = 0
+        for (sample, _), (cv, _) in zip(leg.items, want):
+            if sample.item is not cv: break
+            keep += 1
+        for sample, _ in leg.items[keep:]: leg.removeItem(sample.item)
+        for cv, name in want[keep:]:
+            try: leg.addItem(cv, name)
             except Exception: pass
 
     def apply_series_filter(self, text: str):
@@ -733,13 +1455,11 @@ class DASH(QtWidgets.QMainWindow):
         if action == act_toggle:
             self.ds_for[col] = not self.ds_for.get(col, self.ds_default)
             cv = self.curves.get(col)
-            if cv:
-                try: cv.setClipToView(self.ds_for[col]); cv.setDownsampling(auto=self.ds_for[col])
-                except Exception: pass
+            if cv: self._apply_downsampling(col, cv)
         elif action == act_color:
             colr = QtWidgets.QColorDialog.getColor(parent=self, title=f"Choose color for {col}")
             if colr.isValid():
-                self.pen_active_cache[col] = pg.mkPen(colr, width=2.2)
+                self.pen_active_cache[col] = self._pen_for(colr, 2.2)
                 if self.active_for.get(col, True): self.curves[col].setPen(self.pen_active_cache[col])
         elif action == act_cond:
             preset = self.find_rules.get(col, None)
@@ -758,66 +1478,135 @@ class DASH(QtWidgets.QMainWindow):
         self.btn_ds_global.setText(f"Downsampling: {'ON' if self.ds_default else 'OFF'}")
         for col, cv in self.curves.items():
             self.ds_for[col] = self.ds_default
-            try:
-                cv.setClipToView(self.ds_default); cv.setDownsampling(auto=self.ds_default)
-            except Exception: pass
+            self._apply_downsampling(col, cv)
+        for cv in self.curves_ref.values(): self._ref_downsampling(cv)
+
+    def toggle_gl(self):
+        on = self.btn_gl.isChecked()
+        self.btn_gl.setText(f"GL: {'ON' if on else 'OFF'}")
+        try:
+            pg.setConfigOptions(useOpenGL=on, enableExperimental=on)
+            self.plot.useOpenGL(on)
+        except Exception as e:
+            self.btn_gl.setChecked(False); self.btn_gl.setText("GL: OFF")
+            self.status.showMessage(f"OpenGL unavailable: {e}")
+
+    def on_ds_method_changed(self, method):
+        self.ds_method = method
+        for col, cv in self.curves.items():
+            self._apply_downsampling(col, cv)
+        for cv in self.curves_ref.values(): self._ref_downsampling(cv)
+
+    # ref overlays have no LOD pyramid: pyqtgraph's own clip + auto downsampling, following the global switch
+    def _ref_downsampling(self, cv):
+        cv.setClipToView(True); cv.setDownsampling(auto=self.ds_default, method=self.ds_method)
+
+    # curves get only what the view needs: raw slice when zoomed in, M4 buckets (peak) or a stride
+    # (subsample) when zoomed out; pyqtgraph's own clip/downsample stay off
+    def _lod_select(self, col, y, full=False):
+        x = self.x_sec; n = x.size; vb = self.viewbox
+        if full or vb.width() <= 0: i0, i1 = 0, n
+        else:
+            x0, x1 = vb.viewRange()[0]
+            i0 = max(int(np.searchsorted(x, x0)) - 1, 0); i1 = min(int(np.searchsorted(x, x1, 'right')) + 1, n)
+        width = max(int(vb.width()), 1)
+        if i1 - i0 <= LOD_MIN_BUCKET * width: return (i0, i1), slice(i0, i1)
+        if self.ds_method == 'subsample':
+            step = (i1 - i0) // width; return (i0, i1, step), slice(i0, i1, step)
+        kind = 'log' if self.current_mode == 'log' else 'lin'   # normalize keeps lin's min/max positions
+        levels = self._lod.get((kind, col))
+        if levels is None: levels = self._lod[(kind, col)] = m4_pyramid(y)
+        return m4_select(levels, i0, i1, width, n)
+
+    def _apply_downsampling(self, col, cv, full=False, force=True):
+        y = self._display_mat(self.current_mode)[:, self.col_index[col]]
+        on = self.ds_for.get(col, self.ds_default)
+        key, sel = self._lod_select(col, y, full) if on else (None, slice(None))
+        key = (self.current_mode, on, self.ds_method, key)
+        if not force and key == getattr(cv, '_lod_key', None): return
+        cv._lod_key = key
+        cv.setData(self.x_sec[sel], y[sel])
+
+    def _queue_lod(self, *_):
+        if self.curves and not self._lod_timer.isActive(): self._lod_timer.start()
+
+    def _refresh_lod(self):
+        for col, cv in self.curves.items():
+            if cv.isVisible(): self._apply_downsampling(col, cv, force=False)
+            else: cv._lod_key = None        # re-sliced when shown
 
     # ------------ markers & debug ------------
     def _apply_symbol(self, curve):
-        if self.markers_on:
-            try: curve.setSymbol('o'); curve.setSymbolSize(3); curve.setSymbolBrush(pg.mkBrush(0,0,0,80))
-            except Exception: pass
-        else:
-            try: curve.setSymbol(None)
-            except Exception: pass
+        curve.set_markers(self._brush_for((0,0,0,80)) if self.markers_on else None)
 
     def show_first_only(self):
         if not self.series_cols: return
-        best = None; best_val = -1
-        for c in self.series_cols:
-            y = self.Y_raw[c]; fin = np.abs(y[np.isfinite(y)])
-            if fin.size == 0: continue
-            m = float(np.nanmax(fin))
-            if m > best_val: best_val = m; best = c
-        if best is None: return
-        for c in self.series_cols: self.active_for[c] = (c == best)
-        self._apply_active_styles_to_curves_and_list(); self._update_left_axis_label(); self._fit_view()
+        cands = [c for c in self.series_cols if self.stats[c]['n_finite']]
+        if not cands: return
+        best = max(cands, key=lambda c: self.stats[c]['absmax'])
+        self._set_active(lambda c: c == best)
 
     def toggle_markers(self, state):
         self.markers_on = bool(state)
         for cv in self.curves.values(): self._apply_symbol(cv)
 
     # ------------ hover / click readout ------------
+    def _nearest_index(self, x):
+        # x_sec is sorted: O(log N) lookup of the closest sample, O(1) on a uniform grid
+        n = len(self.x_sec)
+        if self._x_grid is not None:
+            t0, dt = self._x_grid; return min(max(int((x - t0) / dt + 0.5), 0), n - 1)
+        j = self._last_bracket   # hover repeats: same sample bracket as the previous lookup -> no search
+        i = j if 0 < j < n and self.x_sec[j-1] < x <= self.x_sec[j] else int(np.searchsorted(self.x_sec, x))
+        self._last_bracket = i
+        if i <= 0: return 0
+        if i >= n: return n - 1
+        return i - 1 if (x - self.x_sec[i-1]) <= (self.x_sec[i] - x) else i
+
+    def _plot_scene_rect(self):
+        r = self._plot_rect
+        if r is None: r = self._plot_rect = self.plot.plotItem.sceneBoundingRect()
+        return r
+
     def on_mouse_moved(self, pos):
-        if self.x_sec is None or self.x_ns is None: return
-        if not self.plot.sceneBoundingRect().contains(pos): return
-        x = self.plot.plotItem.vb.mapSceneToView(pos).x()
-        idx = int(np.abs(self.x_sec - x).argmin())
-        if idx < 0 or idx >= len(self.x_sec): return
+        # coalesce mouse moves: the readout runs at most once per timer interval with the latest position
+        self._hover_pos = pos
+        if not self._hover_timer.isActive(): self._hover_timer.start()
+
+    def _update_hover(self):
+        pos = self._hover_pos
+        if pos is None or self.x_sec is None or self.x_ns is None or len(self.x_sec) == 0: return
+        if not self._plot_scene_rect().contains(pos): return
+        x = self.viewbox.mapSceneToView(pos).x()
+        idx = self._nearest_index(x)
         self.vline.setPos(self.x_sec[idx])
-        t = pd.Timestamp(self.x_ns[idx], tz=KST, unit='ns')
-        header = t.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] + " KST"
-        active_list = [c for c, a in self.active_for.items() if a]
-        parts = []; max_show = 5
-        for c in active_list[:max_show]:
-            y = self.Y_raw[c]; v = y[idx] if 0 <= idx < len(y) else np.nan
-            s = "nan" if (v is None or not np.isfinite(v)) else f"{v:.6g}"
-            u = unit_from_name(c); parts.append(f"{c}: {s}{(' '+u) if u else ''}")
+        active_list = self._active_cache
+        # same sample and same active set as the last readout -> the text is unchanged, skip formatting it
+        # (_active_cache is rebuilt as a new list on every toggle; the key is reset on reload)
+        key = self._hover_key
+        if key is not None and key[0] == idx and key[1] is active_list and self.status.currentMessage() == self._hover_msg: return
+        header = fmt_kst(self.x_ns[idx]) + " KST"
+        max_show = 5; shown = active_list[:max_show]
+        vals = self.Y_raw_mat[idx, [self.col_index[c] for c in shown]]   # one row fetch
+        parts = []
+        for c, v in zip(shown, vals):
+            label, unit = self._hover_fmt[c]
+            parts.append(f"{label}{v:.6g}{unit}" if np.isfinite(v) else f"{label}nan{unit}")
         more = "" if len(active_list) <= max_show else f" (+{len(active_list)-max_show} more)"
-        self.status.showMessage(f"{header} | " + "  |  ".join(parts) + more)
+        self._hover_key = (idx, active_list); self._hover_msg = f"{header} | " + "  |  ".join(parts) + more
+        self.status.showMessage(self._hover_msg)
 
     def on_plot_clicked(self, evt):
         if self.x_sec is None or self.x_ns is None: return
         if not evt or evt.button() != QtCore.Qt.MouseButton.LeftButton: return
         pos = evt.scenePos() if hasattr(evt, "scenePos") else evt.scenePosition()
-        if not self.plot.sceneBoundingRect().contains(pos): return
-        x = self.plot.plotItem.vb.mapSceneToView(pos).x()
-        idx = int(np.abs(self.x_sec - x).argmin())
+        if not self._plot_scene_rect().contains(pos): return
+        x = self.viewbox.mapSceneToView(pos).x()
+        idx = self._nearest_index(x)
         if idx < 0 or idx >= len(self.x_sec): return
         self.vline.setPos(self.x_sec[idx])
-        t = pd.Timestamp(self.x_ns[idx], tz=KST, unit='ns')
-        header = t.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] + " KST"
-        active_list = sorted([c for c, a in self.active_for.items() if a])
+        header = fmt_kst(self.x_ns[idx]) + " KST"
+        active_list = sorted(self._active_cache)
         lines = [header, ""]
         for col in active_list:
             y = self.Y_raw[col]; v = y[idx] if 0 <= idx < len(y) else np.nan
@@ -852,17 +1641,17 @@ class DASH(QtWidgets.QMainWindow):
         lines = []
         pts = 0 if self.x_sec is None else len(self.x_sec)
         lines.append(f"points={pts}, time_col={self.time_col}\n")
+        if self._skipped_cols: lines.append(f"skipped (not numeric): {', '.join(self._skipped_cols)}\n")
         if not self.series_cols:
             lines.append("(no numeric series)")
         else:
             order = [c for c in self.series_cols if self.active_for.get(c, False)] + \
                     [c for c in self.series_cols if not self.active_for.get(c, False)]
             for c in order:
-                y = self.Y_raw[c]; fin = np.isfinite(y); nonzero = np.abs(y[fin]) > 0
-                if fin.any():
-                    yfin = y[fin]
-                    base = f"{c:<22} active={'Y' if self.active_for.get(c, False) else 'N'}  finite={fin.sum():>6}  nonzero={nonzero.sum():>6}  min={np.nanmin(yfin):.6g}  max={np.nanmax(yfin):.6g}"
-                    if include_original_range: base += f"  (orig range: {np.nanmin(yfin):.6g} .. {np.nanmax(yfin):.6g})"
+                st = self.stats[c]
+                if st['n_finite']:
+                    base = f"{c:<22} active={'Y' if self.active_for.get(c, False) else 'N'}  finite={st['n_finite']:>6}  nonzero={st['nonzero']:>6}  min={st['ymin']:.6g}  max={st['ymax']:.6g}"
+                    if include_original_range: base += f"  (orig range: {st['ymin']:.6g} .. {st['ymax']:.6g})"
                     lines.append(base)
                 else:
                     lines.append(f"{c:<22} active={'Y' if self.active_for.get(c, False) else 'N'}  finite=0      nonzero=0      min=nan      max=nan")
@@ -873,19 +1662,18 @@ class DASH(QtWidgets.QMainWindow):
         if self.x_sec is None or len(self.x_sec)==0: return
         xr, _ = self.plot.getPlotItem().vb.viewRange()
         xmin, xmax = xr
-        mask = (self.x_sec >= xmin) & (self.x_sec <= xmax)
-        if not mask.any():
+        # x_sec is sorted: the visible rows are one contiguous slice (views, no N-sized mask)
+        lo = int(np.searchsorted(self.x_sec, xmin, side='left')); hi = int(np.searchsorted(self.x_sec, xmax, side='right'))
+        if hi <= lo:
             QtWidgets.QMessageBox.information(self, "Export CSV", "No points in current visible X range."); return
-        active_cols = [c for c, a in self.active_for.items() if a]
+        active_cols = self._active_cache
         if not active_cols:
             QtWidgets.QMessageBox.information(self, "Export CSV", "No active series selected."); return
-        ts = pd.to_datetime((self.x_sec[mask] * 1e9).astype("int64"), utc=True).tz_convert(KST)
-        data = {"Timestamp (KST)": ts}
-        for c in active_cols: data[c] = self.Y_raw[c][mask]
-        out = pd.DataFrame(data)
         path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Save CSV", "dash_visible.csv", "CSV Files (*.csv)")
         if not path: return
-        try: out.to_csv(path, index=False); self.status.showMessage(f"Exported CSV: {path}")
+        try:
+            write_export_csv(path, self.x_ns[lo:hi], {c: self.Y_raw[c][lo:hi] for c in active_cols})
+            self.status.showMessage(f"Exported CSV: {path}")
         except Exception as e: QtWidgets.QMessageBox.critical(self, "Export CSV Error", str(e))
 
     def export_plot_png(self):
@@ -946,9 +1734,9 @@ class DASH(QtWidgets.QMainWindow):
         if self.x_sec is None: return
         xr, _ = self.plot.getPlotItem().vb.viewRange()
         xmid = 0.5*(xr[0]+xr[1])
-        idx = int(np.abs(self.x_sec - xmid).argmin())
+        idx = self._nearest_index(xmid)
         x_ns = int(self.x_ns[idx])
-        t = pd.Timestamp(x_ns, tz=KST, unit='ns').strftime("%Y-%m-%d %H:%M:%S")
+        t = fmt_kst(x_ns, ms=False)
         label, ok = QtWidgets.QInputDialog.getText(self, "Add Bookmark", f"Label (default {t}):")
         if not ok: return
         if not label: label = t
@@ -982,7 +1770,7 @@ class DASH(QtWidgets.QMainWindow):
         self.status.showMessage("Highlight mode ON: click two points to mark region." if self.highlight_mode else "Highlight mode OFF")
 
     def add_threshold_line(self, col:str, value:float):
-        line = pg.InfiniteLine(angle=0, movable=False, pen=pg.mkPen(200,0,0,120))
+        line = pg.InfiniteLine(angle=0, movable=False, pen=self._pen_for((200,0,0,120)))
         self.plot.addItem(line, ignoreBounds=True)
         txt = pg.TextItem(html=f"<span style='color:#a00'>TH {col}: {value:g}</span>", anchor=(0,1))
         self.plot.addItem(txt, ignoreBounds=True)
@@ -995,7 +1783,7 @@ class DASH(QtWidgets.QMainWindow):
         x = self.vline.value() if hasattr(self.vline, 'value') else None
         if x is None:
             xr, _ = self.plot.getPlotItem().vb.viewRange(); x = 0.5*(xr[0]+xr[1])
-        idx = int(np.abs(self.x_sec - x).argmin())
+        idx = self._nearest_index(x)
         x_ns = int(self.x_ns[idx])
         text, ok = QtWidgets.QInputDialog.getText(self, "Add Event / Note", "Label:")
         if not ok or not text: return
@@ -1003,42 +1791,34 @@ class DASH(QtWidgets.QMainWindow):
 
     def _add_event_line(self, x_ns:int, text:str, color=(0,120,200)):
         x_sec = x_ns/1e9
-        line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen(color, width=1.5))
+        line = pg.InfiniteLine(angle=90, movable=False, pen=self._pen_for(color, 1.5))
         self.plot.addItem(line, ignoreBounds=True); line.setPos(x_sec)
         lbl = pg.TextItem(text=text, anchor=(0,1))
         self.plot.addItem(lbl, ignoreBounds=True); lbl.setPos(x_sec, self.plot.getPlotItem().vb.viewRange()[1][1])
         self.event_items.append({'x_ns':x_ns, 'line': line, 'label': lbl, 'series': None, 'text': text})
-        t = pd.Timestamp(x_ns, tz=KST, unit='ns').strftime("%Y-%m-%d %H:%M:%S")
+        t = fmt_kst(x_ns, ms=False)
         self.list_events.addItem(f"{t} | {text}")
 
     # ------------ Conditions ------------
     def run_event_finder(self):
         if self.x_sec is None or not self.find_rules: return
-        for col, rules in self.find_rules.items():
-            y = self.Y_raw.get(col); 
-            if y is None or y.size < 2: continue
-            valid = np.isfinite(y)
-            xs = self.x_ns[valid]; yy = y[valid]
-            hits_idx = np.zeros_like(yy, dtype=bool)
-            if 'gt' in rules: hits_idx |= (yy > float(rules['gt']))
-            if 'lt' in rules: hits_idx |= (yy < float(rules['lt']))
-            if 'deltapct' in rules:
-                dy = np.empty_like(yy); dy[:] = np.nan
-                dy[1:] = np.abs((yy[1:] - yy[:-1]) / np.where(yy[:-1]==0, np.nan, yy[:-1])) * 100.0
-                hits_idx |= (dy >= float(rules['deltapct']))
-            where = np.where(hits_idx)[0]
-            for i in where:
-                x_ns = int(xs[i])
-                label = []
-                if 'gt' in rules and yy[i] > float(rules['gt']): label.append(f"{col}>")
-                if 'lt' in rules and yy[i] < float(rules['lt']): label.append(f"{col}<")
-                if 'deltapct' in rules and i>0:
-                    pct = abs((yy[i]-yy[i-1])/(yy[i-1] if yy[i-1]!=0 else np.nan))*100.0
-                    if np.isfinite(pct) and pct >= float(rules['deltapct']): label.append(f"{col} Δ{pct:.1f}%")
-                text = " / ".join(label) if label else col
-                self._add_event_line(x_ns, text)
-                tt = pd.Timestamp(x_ns, tz=KST, unit='ns').strftime("%Y-%m-%d %H:%M:%S")
-                self.list_events.addItem(f"{tt} | {text}")
+        if len(self.x_sec) < 2: return
+        cols = [c for c in self.find_rules if c in self.col_index]
+        rules = [self.find_rules[c] for c in cols]
+        ks, rows, codes, pcts = scan_events(self.Y_raw_mat, [self.col_index[c] for c in cols],
+                                            [float(r.get('gt', np.nan)) for r in rules],
+                                            [float(r.get('lt', np.nan)) for r in rules],
+                                            [float(r.get('deltapct', np.nan)) for r in rules])
+        for k, i, code, pct in zip(ks.tolist(), rows.tolist(), codes.tolist(), pcts.tolist()):
+            col = cols[k]; x_ns = int(self.x_ns[i])
+            label = []
+            if code & EV_GT: label.append(f"{col}>")
+            if code & EV_LT: label.append(f"{col}<")
+            if code & EV_DP: label.append(f"{col} Δ{pct:.1f}%")
+            text = " / ".join(label) if label else col
+            self._add_event_line(x_ns, text)
+            tt = fmt_kst(x_ns, ms=False)
+            self.list_events.addItem(f"{tt} | {text}")
 
     def jump_event_item(self, it: QtWidgets.QListWidgetItem):
         if it is None: return
@@ -1066,38 +1846,28 @@ class DASH(QtWidgets.QMainWindow):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open Ref Data File", "", "Data Files (*.csv *.tsv *.dat);;All Files (*)")
         if not path: return
         try:
-            delim = sniff_delimiter_quick(path)
-            if HAS_POLARS:
-                df = pl.read_csv(path, infer_schema_length=10000, has_header=True) if delim is None else \
-                     pl.read_csv(path, infer_schema_length=10000, separator=delim, has_header=True)
-                tcol = next((c for c in TIME_COL_CANDIDATES if c in df.columns), df.columns[0])
-                ts_expr = pl.col(tcol).str.strptime(pl.Datetime, strict=False, exact=False)
-                df = df.with_columns([ts_expr.alias("_ts_").dt.replace_time_zone("UTC").dt.convert_time_zone("Asia/Seoul")]) \
-                       .drop_nulls(["_ts_"]).sort("_ts_")
-                num_cols = [c for c, dt in zip(df.columns, df.dtypes) if c not in (tcol, "_ts_") and is_numeric_polars_dtype(dt)]
-                x_ns  = df["_ts_"].dt.timestamp("ns").to_numpy().astype("int64", copy=False)
-                x_sec = x_ns.astype("float64") / 1e9
-                Y_raw = {col: df[col].to_numpy().astype("float64", copy=False) for col in num_cols}
-            else:
-                df = pd.read_csv(path, sep=delim) if delim is not None else pd.read_csv(path, sep=None, engine="python")
-                tcol = next((c for c in TIME_COL_CANDIDATES if c in df.columns), df.columns[0])
-                ts = pd.to_datetime(df[tcol], errors="coerce").dt.tz_localize("UTC").dt.tz_convert(KST)
-                df = df.assign(_ts_=ts).dropna(subset=["_ts_"]).sort_values("_ts_")
-                num_cols = [c for c in df.columns if c not in (tcol, "_ts_") and pd.api.types.is_numeric_dtype(df[c])]
-                x_ns  = df["_ts_"].view("int64").to_numpy()
-                x_sec = x_ns.astype("float64") / 1e9
-                Y_raw = {col: pd.to_numeric(df[col], errors='coerce').to_numpy(dtype="float64", copy=False) for col in num_cols}
-            self.compare_data = {'x_ns': x_ns, 'x_sec': x_sec, 'Y_raw': Y_raw, 'series_cols': list(Y_raw.keys())}
+            delim, _ = sniff_delimiter_quick(path)
+            _, num_cols, x_ns, Y = read_table(path, delim, cols=self.series_cols)   # only overlay-able columns
+            x_sec = np.multiply(x_ns, 1e-9, dtype=np.float64)
+            Y_raw = {col: Y[:, j] for j, col in enumerate(num_cols)}
+            _, n_finite = finite_rows(Y)
+            all_finite = {col: bool(n_finite[j] == Y.shape[0]) for j, col in enumerate(num_cols)}
+            self.compare_data = {'x_ns': x_ns, 'x_sec': x_sec, 'Y_raw': Y_raw, 'all_finite': all_finite,
+                                 'series_cols': list(Y_raw.keys())}
             self.plot_compare_overlay()
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "Compare Error", str(e))
 
     def plot_compare_overlay(self):
         if not self.compare_data: return
-        common = [c for c in self.series_cols if c in self.compare_data['series_cols']]
+        ref_cols = set(self.compare_data['series_cols'])
+        common = [c for c in self.series_cols if c in ref_cols]
         for c in common:
-            cv = self.plot.plot(self.compare_data['x_sec'], self.compare_data['Y_raw'][c],
-                                name=f"{c} (ref)", pen=pg.mkPen((60,60,60,140), width=1.5, style=QtCore.Qt.PenStyle.DotLine))
+            skip = self.compare_data['all_finite'][c]
+            cv = ThrottledPlotDataItem(self.compare_data['x_sec'], self.compare_data['Y_raw'][c],   # x shared by every ref curve
+                                       name=f"{c} (ref)", pen=self._pen_for((60,60,60,140), 1.5, QtCore.Qt.PenStyle.DotLine),
+                                       connect='all' if skip else 'finite', skipFiniteCheck=skip)
+            self.plot.addItem(cv); self._ref_downsampling(cv)   # after addItem, which resets both
             self.curves_ref[c] = cv
         self._refresh_legend()
 
@@ -1122,9 +1892,10 @@ class DASH(QtWidgets.QMainWindow):
         )
 
 def main():
-    QtCore.QCoreApplication.setAttribute(QtCore.Qt.ApplicationAttribute.AA_UseSoftwareOpenGL)
+    if not USE_OPENGL: QtCore.QCoreApplication.setAttribute(QtCore.Qt.ApplicationAttribute.AA_UseSoftwareOpenGL)
     app = QtWidgets.QApplication(sys.argv)
     win = DASH(); win.show()
+    QtCore.QTimer.singleShot(0, win.warm_jit_async)   # compile the condition scan before the first "Run Conditions"
     sys.exit(app.exec())
 
 if __name__ == "__main__":
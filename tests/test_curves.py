@@ -0,0 +1,58 @@
+import os, sys, tempfile, unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import numpy as np, pandas as pd
+from pyqtgraph.Qt import QtWidgets
+import main
+
+
+class FiniteCheckTest(unittest.TestCase):
+    # fully finite series skip pyqtgraph's per-paint finite scan; series with gaps keep it
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "curves.csv")
+        n = 1000; rng = np.random.default_rng(0)
+        df = pd.DataFrame({"Date UTC": pd.date_range("2024-01-01", periods=n, freq="s").strftime("%Y-%m-%d %H:%M:%S"),
+                           "gappy": rng.normal(0, 1, n), "clean": rng.normal(0, 2, n)})
+        df.loc[100:120, "gappy"] = np.nan
+        df.to_csv(cls.path, index=False)
+        cls.w = main.DASH(); cls.w.path_edit.setText(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.w.close(); cls.tmp.cleanup()
+
+    def load(self):
+        self.w._on_loaded(main.prepare_table(self.path))
+
+    def assert_skip(self, curves):
+        self.assertTrue(curves["clean"].curve.opts['skipFiniteCheck'])
+        self.assertEqual(curves["clean"].curve.opts['connect'], 'all')
+        self.assertFalse(curves["gappy"].curve.opts['skipFiniteCheck'])
+
+    def test_first_load_and_reload(self):
+        self.load(); self.assert_skip(self.w.curves)   # new curves
+        self.load(); self.assert_skip(self.w.curves)   # curves reused across the reload
+
+    def test_modes(self):
+        self.load()
+        self.w.set_scale("log")
+        self.assertFalse(any(cv.curve.opts['skipFiniteCheck'] for cv in self.w.curves.values()))
+        self.w.set_scale("linear"); self.assert_skip(self.w.curves)
+
+    def test_ref_curves(self):
+        self.load()
+        get = QtWidgets.QFileDialog.getOpenFileName
+        QtWidgets.QFileDialog.getOpenFileName = staticmethod(lambda *a, **k: (self.path, ""))
+        try:
+            self.w.btn_compare.setChecked(True); self.w.toggle_compare_mode(); self.w.open_compare_file()
+            self.assert_skip(self.w.curves_ref)
+        finally:
+            QtWidgets.QFileDialog.getOpenFileName = get
+            self.w.btn_compare.setChecked(False); self.w.toggle_compare_mode()
+
+
+if __name__ == "__main__":
+    unittest.main()
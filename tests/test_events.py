@@ -0,0 +1,49 @@
+import os, sys, unittest
+from unittest import mock
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import numpy as np
+import main
+
+NAN = np.nan
+
+
+def scan(Y, cols, gt, lt, dp, jit):
+    with mock.patch.object(main, "HAS_NUMBA", jit and main.HAS_NUMBA):
+        return main.scan_events(Y, cols, gt, lt, dp)
+
+
+class ScanEventsTest(unittest.TestCase):
+    def test_rules(self):
+        # strict thresholds, Δ% against the previous finite value, none after a zero
+        Y = np.asfortranarray(np.array([[1.0, 2.0, NAN, 1.5, 0.0, 3.0]]).T)
+        for jit in (False, True):
+            k, rows, codes, pct = scan(Y, [0], [1.5], [1.0], [50.0], jit)
+            np.testing.assert_array_equal(rows, [1, 4, 5])
+            np.testing.assert_array_equal(codes, [main.EV_GT | main.EV_DP, main.EV_LT | main.EV_DP, main.EV_GT])
+            np.testing.assert_array_equal(pct, [100.0, 100.0, NAN])
+            np.testing.assert_array_equal(k, [0, 0, 0])
+
+    @unittest.skipUnless(main._jit_ready(), "numba not installed")
+    def test_numba_matches_numpy(self):
+        rng = np.random.default_rng(0); n = 50_000
+        Y = np.asfortranarray(rng.normal(10.0, 3.0, (n, 5)).round(1))   # rounding puts values exactly on thresholds
+        Y[1000:1500, 0] = NAN; Y[::97, 1] = NAN; Y[:10, 2] = NAN; Y[-10:, 2] = NAN   # gaps, leading / trailing NaN
+        Y[::53, 3] = 0.0; Y[::89, 3] = np.inf; Y[:, 4] = NAN                       # zeros before a Δ%, Inf, all NaN
+        rules = [([10.0] * 5, [NAN] * 5, [NAN] * 5),                 # one rule at a time
+                 ([NAN] * 5, [7.5] * 5, [NAN] * 5),
+                 ([NAN] * 5, [NAN] * 5, [25.0] * 5),
+                 ([13.0, NAN, 10.0, 12.0, 0.0], [7.0, 8.0, NAN, 9.0, 1.0], [40.0, 0.0, NAN, 30.0, 5.0]),
+                 ([NAN] * 5, [NAN] * 5, [NAN] * 5)]                  # no rule at all
+        for cols in ([0, 1, 2, 3, 4], [3, 0], []):
+            for gt, lt, dp in rules:
+                m = len(cols)
+                a = scan(Y, cols, gt[:m], lt[:m], dp[:m], jit=False)
+                b = scan(Y, cols, gt[:m], lt[:m], dp[:m], jit=True)
+                for x, y in zip(a, b, strict=True):
+                    np.testing.assert_array_equal(x, y, err_msg=f"cols={cols} gt={gt} lt={lt} dp={dp}")
+                    self.assertEqual(x.dtype, y.dtype)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os, sys, tempfile, unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import numpy as np
+import main
+
+
+@unittest.skipUnless(main.HAS_POLARS, "polars not installed")
+class ExportBackendsTest(unittest.TestCase):
+    # the same visible range must export to the same bytes whichever backend writes it
+    def export_both(self, x_ns, series):
+        out = []
+        with tempfile.TemporaryDirectory() as d:
+            for use_polars in (True, False):
+                path = os.path.join(d, f"{use_polars}.csv")
+                main.write_export_csv(path, x_ns, series, use_polars=use_polars)
+                with open(path, "rb") as f: out.append(f.read())
+        return out
+
+    def test_sub_second_times(self):
+        base = 1_700_000_000 * 10**9
+        for offs in ([0, 10**9], [0, 100_000_000, 200_000_000],          # whole seconds, milliseconds
+                     [0, 1_000, 100_001_000], [0, 1, 2_000_000_000],      # microseconds, nanoseconds
+                     [-1_500_000_000 - base, -base, 250_000_000 - base]):  # before 1970
+            x_ns = base + np.array(offs, dtype=np.int64)
+            y = np.linspace(-1.0, 1.0, x_ns.size)
+            pl_out, pd_out = self.export_both(x_ns, {"a": y})
+            self.assertEqual(pl_out, pd_out)
+
+    def test_float_text(self):
+        rng = np.random.default_rng(0)
+        n = 20_000
+        x_ns = 1_700_000_000 * 10**9 + np.arange(n, dtype=np.int64) * 100_000_000
+        for dtype in (np.float64, np.float32):
+            y = (rng.standard_normal(n) * 10.0 ** rng.uniform(-12, 20, n)).astype(dtype)
+            y[::7] = 0.0; y[::11] = -0.0; y[::13] = np.nan; y[::17] = np.inf; y[::19] = -np.inf
+            z = rng.normal(20.0, 1.0, n).astype(dtype); z[5:9] = np.nan
+            pl_out, pd_out = self.export_both(x_ns, {"a": y, "b": z})
+            self.assertEqual(pl_out, pd_out, dtype.__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
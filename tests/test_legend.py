@@ -0,0 +1,49 @@
+import os, sys, tempfile, unittest
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import numpy as np, pandas as pd
+from pyqtgraph.Qt import QtWidgets
+import main
+
+
+class LegendOrderTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        cls.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(cls.tmp.name, "legend.csv")
+        n = 500; rng = np.random.default_rng(0)
+        df = pd.DataFrame({"Date UTC": pd.date_range("2024-01-01", periods=n, freq="s").strftime("%Y-%m-%d %H:%M:%S")})
+        for i, c in enumerate(["s_a", "s_b", "s_c", "s_d", "s_e"]): df[c] = rng.normal(0, i + 1, n)
+        df.to_csv(path, index=False)
+        cls.w = main.DASH(); cls.w.path_edit.setText(path)
+        cls.w._on_loaded(main.prepare_table(path))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.w.close(); cls.tmp.cleanup()
+
+    def legend_names(self):
+        return [label.text for _, label in self.w.plot.plotItem.legend.items]
+
+    def toggle(self, col):
+        self.w.on_item_clicked(self.w.list_series.findItems(col, main.QtCore.Qt.MatchFlag.MatchExactly)[0])
+
+    def test_reshown_series_keeps_its_place(self):
+        order = list(self.w.curves)
+        self.assertEqual(self.legend_names(), order)
+        mid = order[2]
+        self.toggle(mid); self.assertEqual(self.legend_names(), [c for c in order if c != mid])
+        self.toggle(mid); self.assertEqual(self.legend_names(), order)
+        # several hidden, shown back in a different order
+        self.toggle(order[1]); self.toggle(order[3]); self.toggle(order[3]); self.toggle(order[1])
+        self.assertEqual(self.legend_names(), order)
+        self.w.select_all_off(); self.w.select_invert()
+        self.assertEqual(self.legend_names(), order)
+        self.app.processEvents()   # on screen too: rows top to bottom in the same order
+        ys = [label.geometry().y() for _, label in self.w.plot.plotItem.legend.items]
+        self.assertEqual(ys, sorted(ys))
+
+
+if __name__ == "__main__":
+    unittest.main()
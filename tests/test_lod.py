@@ -0,0 +1,87 @@
+import os, sys, unittest
+from unittest import mock
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import numpy as np
+import main
+
+
+def series(n=100_003, seed=0):
+    y = np.random.default_rng(seed).normal(0, 1, n).cumsum()
+    y[5000:5100] = np.nan                        # a gap across whole level-0 buckets
+    y[7003] = np.nan; y[7010:7013] = np.nan      # NaN inside a bucket that still has values
+    y[-3:] = np.nan                              # ragged, partly NaN last bucket
+    return y
+
+
+def pyramid(y, jit):
+    with mock.patch.object(main, "HAS_NUMBA", jit and main.HAS_NUMBA):
+        return main.m4_pyramid(y)
+
+
+class M4PyramidTest(unittest.TestCase):
+    # every level: per bucket of b samples, imin / imax point at the bucket's smallest / largest finite value
+    def check_levels(self, y, levels):
+        n = y.size
+        self.assertEqual(levels[0][0], main.LOD_MIN_BUCKET)
+        for (b, _, _), (b2, _, _) in zip(levels, levels[1:]): self.assertEqual(b2, b * main.LOD_FACTOR)
+        self.assertGreaterEqual(levels[-1][1].size, main.LOD_MIN_BUCKETS)
+        for b, imin, imax in levels:
+            self.assertEqual(imin.size, -(-n // b))
+            for k in range(imin.size):
+                s, e = k * b, min(k * b + b, n); seg = y[s:e]
+                self.assertTrue(s <= imin[k] < e and s <= imax[k] < e, (b, k))
+                if np.isnan(seg).all():   # all-NaN bucket: its first sample, never a neighbour's
+                    self.assertEqual((imin[k], imax[k]), (s, s), (b, k))
+                else:
+                    self.assertEqual(y[imin[k]], np.nanmin(seg), (b, k))
+                    self.assertEqual(y[imax[k]], np.nanmax(seg), (b, k))
+
+    def test_numpy_kernel(self):
+        y = series(); self.check_levels(y, pyramid(y, jit=False))
+
+    @unittest.skipUnless(main._jit_ready(), "numba not installed")
+    def test_numba_kernel(self):
+        y = series(); self.check_levels(y, pyramid(y, jit=True))
+
+    @unittest.skipUnless(main._jit_ready(), "numba not installed")
+    def test_kernels_agree(self):
+        for n in (1, 15, 16, 17, 4096, 100_003):
+            y = series(n, seed=n) if n > 8000 else np.random.default_rng(n).normal(0, 1, n)
+            for (b1, lo1, hi1), (b2, lo2, hi2) in zip(pyramid(y, jit=False), pyramid(y, jit=True), strict=True):
+                self.assertEqual(b1, b2)
+                np.testing.assert_array_equal(lo1, lo2); np.testing.assert_array_equal(hi1, hi2)
+
+
+class M4SelectTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.y = series(); cls.levels = pyramid(cls.y, jit=False)
+
+    def test_points_per_bucket(self):
+        n = self.y.size
+        for i0, i1, width in ((0, n, 800), (12_345, 67_891, 300), (n - 5000, n, 100)):
+            (b, k0, k1), idx = main.m4_select(self.levels, i0, i1, width, n)
+            _, imin, imax = next(lvl for lvl in self.levels if lvl[0] == b)
+            self.assertEqual((k0, k1), (i0 // b, -(-i1 // b)))
+            pts = idx.reshape(-1, 4)
+            self.assertEqual(pts.shape[0], k1 - k0)
+            for k, (first, a, c, last) in zip(range(k0, k1), pts):
+                s, e = k * b, min(k * b + b, n)
+                self.assertEqual((first, last), (s, e - 1))   # first / last sample of the bucket
+                self.assertEqual((a, c), tuple(sorted((imin[k], imax[k]))))   # min / max in index order
+            self.assertTrue((np.diff(idx) >= 0).all())
+
+    def test_level_for_pixel_width(self):
+        n = self.y.size
+        for i0, i1 in ((0, n), (1000, 41_000), (50_000, 52_000)):
+            for width in (1, 100, 400, 1000, 10_000):
+                (b, k0, k1), _ = main.m4_select(self.levels, i0, i1, width, n)
+                # coarsest level still giving at least `width` buckets over the range; level 0 if none does
+                want = max([lb for lb, _, _ in self.levels if (i1 - i0) // lb >= width], default=self.levels[0][0])
+                self.assertEqual(b, want, (i0, i1, width))
+                self.assertTrue(k1 - k0 >= width or b == self.levels[0][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os, sys, tempfile, unittest
+from unittest import mock
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import main
+
+
+class DetectTimeFormatTest(unittest.TestCase):
+    def test_iso(self):
+        self.assertEqual(main.detect_time_format(["2024-01-02 03:04:05", "2024-01-02 03:04:06.5"]),
+                         ("%Y-%m-%d %H:%M:%S%.f", "ISO8601"))
+        self.assertEqual(main.detect_time_format([" 2024-01-02T03:04:05.123 "]), ("%Y-%m-%dT%H:%M:%S%.f", "ISO8601"))
+        self.assertEqual(main.detect_time_format(["2024/01/02 03:04:05"]), ("%Y/%m/%d %H:%M:%S%.f", "%Y/%m/%d %H:%M:%S"))
+
+    def test_day_first(self):
+        # ambiguous dates read day-first; month-first only once a sample rules day-first out
+        f = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S")
+        self.assertEqual(main.detect_time_format(["02/01/2024 10:00:00", "03/01/2024 10:00:00"]), f)
+        self.assertEqual(main.detect_time_format(["13/01/2024 10:00:00", "14/01/2024 10:00:00"]), f)
+        self.assertEqual(main.detect_time_format(["01/02/2024 10:00", "01/13/2024 10:00"]), ("%m/%d/%Y %H:%M", "%m/%d/%Y %H:%M"))
+
+    def test_not_pinned(self):
+        # epoch seconds as text, tz-aware stamps, nothing to look at: left to per-row inference
+        for samples in (["1700000000", "1700000001"], ["1700000000.5"], ["2024-01-02T03:04:05+09:00"], []):
+            self.assertIsNone(main.detect_time_format(samples), samples)
+
+    def test_epoch_seconds_column(self):
+        # a numeric time column is refused by dtype, on both backends, before any parse attempt
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "epoch.csv")
+            with open(path, "w") as f: f.write("Date UTC,a\n" + "".join(f"{1_700_000_000 + i},{i}\n" for i in range(10)))
+            for use_polars in {False, main.HAS_POLARS}:
+                with mock.patch.object(main, "HAS_POLARS", use_polars):
+                    with self.assertRaisesRegex(ValueError, "not a date/time column"): main.read_table(path, ",")
+
+
+class SniffDelimiterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory(); self.addCleanup(self.tmp.cleanup)
+
+    def sniff(self, text, name="t.csv"):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", newline="") as f: f.write(text)
+        return main.sniff_delimiter_quick(path)
+
+    def rows(self, fmt, n=30):
+        return "".join(fmt.format(i=i, s=f"2024-01-01 00:00:{i:02d}") for i in range(n))
+
+    def test_semicolon_with_commas_in_header(self):
+        # ';' separated, decimal commas in the data and commas in the header names: only ';' is consistent
+        self.assertEqual(self.sniff("Date UTC;temp, C;volt\n" + self.rows("{s};21,{i};3,3\n")),
+                         (";", ["Date UTC", "temp, C", "volt"]))
+
+    def test_comma_with_semicolon_in_header(self):
+        self.assertEqual(self.sniff("Date UTC,a;b,c\n" + self.rows("{s},{i},1,{i}\n")), (",", ["Date UTC", "a;b", "c"]))
+
+    def test_crlf_bom_quotes(self):
+        self.assertEqual(self.sniff('\ufeff"Date UTC";"a";"b"\r\n' + self.rows("{s};{i};{i}\r\n", 3)),
+                         (";", ["Date UTC", "a", "b"]))
+
+    def test_extension_hints(self):
+        self.assertEqual(self.sniff("Date UTC,x\n2024,1\n", "t.tsv")[0], "\t")
+        self.assertEqual(self.sniff("Date UTC x y\n2024 1 2\n2024 3 4\n", "t.dat"), (" ", ["Date", "UTC", "x", "y"]))
+
+
+if __name__ == "__main__":
+    unittest.main()